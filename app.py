@@ -6,9 +6,16 @@ A Flask web application that accepts YouTube video IDs and displays transcripts.
 Refactored version with modular architecture.
 """
 
+import logging
 from flask import Flask
-from src.database_storage import database_storage
+from src.database_storage import get_storage
 from src.config import Config
+from src.utils.json_provider import ORJSONProvider, ORJSON_AVAILABLE
+try:
+    from flask_compress import Compress
+    COMPRESS_AVAILABLE = True
+except ImportError:
+    COMPRESS_AVAILABLE = False
 
 # Import route blueprints
 from src.routes.main import main_bp
@@ -22,6 +29,27 @@ def create_app():
     """Application factory pattern"""
     app = Flask(__name__)
     
+    logging.basicConfig(
+        level=getattr(logging, Config.LOG_LEVEL, logging.WARNING),
+        format='%(asctime)s %(levelname)s %(name)s: %(message)s'
+    )
+    
+    # Let browsers cache static assets; in production nginx serves them directly
+    app.config['SEND_FILE_MAX_AGE_DEFAULT'] = Config.STATIC_MAX_AGE
+    
+    # Serialize JSON responses with orjson when available
+    if ORJSON_AVAILABLE:
+        app.json = ORJSONProvider(app)
+    
+    # Compress HTML and JSON responses (Brotli when the client accepts it)
+    if COMPRESS_AVAILABLE:
+        app.config['COMPRESS_ALGORITHM'] = ['br', 'gzip']
+        # Streamed transcript/snippet JSON is compressed chunk by chunk; flask-compress
+        # leaves gzip out of streaming by default, so gzip-only clients got it uncompressed
+        app.config['COMPRESS_ALGORITHM_STREAMING'] = ['br', 'gzip', 'deflate']
+        app.config['COMPRESS_MIN_SIZE'] = 1024
+        Compress(app)
+    
     # Register blueprints
     app.register_blueprint(main_bp)
     app.register_blueprint(api_bp)
@@ -36,15 +64,18 @@ def main():
     """Main entry point"""
     app = create_app()
     
-    # Initialize database storage on startup
-    database_storage.clear_expired()
-    
     # Get configuration
     proxy = Config.YOUTUBE_PROXY
     host = Config.FLASK_HOST
     port = Config.FLASK_PORT
     debug = Config.FLASK_DEBUG
     
+    if not debug:
+        # The Werkzeug server handles one request at a time; use a WSGI server in production
+        print("Warning: FLASK_DEBUG is off but the development server is starting.")
+        print("For production, start the app with: gunicorn -c gunicorn.conf.py")
+        print(f"  (equivalent to: gunicorn -k gthread -w 4 --threads 8 -b {host}:{port} wsgi:application)")
+    
     if proxy:
         print(f"Using proxy: {proxy}")
     else:
@@ -52,9 +83,15 @@ def main():
     
     print(f"OpenAI API configured: {Config.is_openai_configured()}")
     
-    # Show database info
-    cache_info = database_storage.get_cache_info()
-    print(f"Database: {cache_info['videos_count']} videos, {cache_info['transcripts_count']} transcripts, {cache_info['summaries_count']} summaries")
+    # Initialize database storage and show database info; an unreachable
+    # database is reported but doesn't stop the development server
+    try:
+        database_storage = get_storage()
+        database_storage.clear_expired()
+        cache_info = database_storage.get_cache_info()
+        print(f"Database: {cache_info['videos_count']} videos, {cache_info['transcripts_count']} transcripts, {cache_info['summaries_count']} summaries")
+    except Exception as e:
+        print(f"Database unavailable at startup: {e}")
     
     app.run(host=host, port=port, debug=debug)
 
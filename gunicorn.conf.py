@@ -0,0 +1,30 @@
+"""
+Gunicorn configuration for the YouTube Deep Summary application
+
+Run with: gunicorn -c gunicorn.conf.py
+"""
+import multiprocessing
+import os
+
+# WSGI entry point (see wsgi.py)
+wsgi_app = 'wsgi:application'
+
+bind = f"{os.getenv('FLASK_HOST', '0.0.0.0')}:{os.getenv('FLASK_PORT', '33079')}"
+
+# Threaded workers by default: slow AI summary calls and quick cache hits run side by side.
+# Set GUNICORN_WORKER_CLASS=gevent (pip install gevent) to hold hundreds of pending
+# YouTube/OpenAI/Supabase requests per worker; gunicorn monkey-patches sockets before
+# the app is imported so requests and httpx yield instead of blocking.
+worker_class = os.getenv('GUNICORN_WORKER_CLASS', 'gthread')
+workers = int(os.getenv('GUNICORN_WORKERS', multiprocessing.cpu_count() * 2 + 1))
+threads = int(os.getenv('GUNICORN_THREADS', 8))
+worker_connections = int(os.getenv('GUNICORN_WORKER_CONNECTIONS', 1000))
+
+# Summaries and channel imports can take well over a minute
+timeout = int(os.getenv('GUNICORN_TIMEOUT', 120))
+graceful_timeout = 30
+keepalive = 5
+
+accesslog = '-'
+errorlog = '-'
+loglevel = os.getenv('LOG_LEVEL', 'warning').lower()
@@ -0,0 +1,17 @@
+-- Indexes for channel pages and per-channel video listings
+-- Copy and paste these commands into your Supabase SQL Editor
+
+-- Every channel page resolves its URL handle to a channel row first.
+CREATE INDEX IF NOT EXISTS idx_youtube_channels_handle ON youtube_channels(handle);
+
+-- Channel video lists filter by channel and sort by publish or added date;
+-- composite indexes return rows already in order instead of sorting the
+-- channel's videos (also used by the channel_overview_stats view).
+CREATE INDEX IF NOT EXISTS idx_youtube_videos_channel_published
+ON youtube_videos(channel_id, published_at DESC);
+CREATE INDEX IF NOT EXISTS idx_youtube_videos_channel_created
+ON youtube_videos(channel_id, created_at DESC);
+
+-- Current-summary lookups filter on is_current for one or many videos.
+CREATE INDEX IF NOT EXISTS idx_summaries_current_video
+ON summaries(video_id) WHERE is_current;
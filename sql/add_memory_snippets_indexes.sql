@@ -0,0 +1,23 @@
+-- Indexes for memory snippet listing
+-- Copy and paste these commands into your Supabase SQL Editor
+
+-- Snippets are always listed newest first, either overall or per video.
+-- A composite index lets per-video listings read rows already in order.
+CREATE INDEX IF NOT EXISTS idx_memory_snippets_video_created
+ON memory_snippets(video_id, created_at DESC);
+
+-- Snippet listings embed youtube_videos -> youtube_channels. memory_snippets has
+-- no foreign key to youtube_videos (snippets are kept when their video is
+-- deleted), so declare the relationship as a PostgREST computed relationship
+-- instead of a constraint. No rows are changed or deleted.
+CREATE OR REPLACE FUNCTION youtube_videos(memory_snippets)
+RETURNS SETOF youtube_videos ROWS 1
+LANGUAGE sql STABLE
+AS $$
+    SELECT * FROM youtube_videos WHERE video_id = $1.video_id
+$$;
+
+-- Make PostgREST pick up the new relationship without a restart
+NOTIFY pgrst, 'reload schema';
+
+ANALYZE memory_snippets;
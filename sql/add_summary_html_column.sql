@@ -0,0 +1,8 @@
+-- Store rendered HTML next to each summary
+-- Pages serve summary_html directly instead of converting markdown on every view.
+-- Existing summaries are rendered and stored the first time they are read.
+
+ALTER TABLE summaries
+ADD COLUMN IF NOT EXISTS summary_html TEXT;
+
+COMMENT ON COLUMN summaries.summary_html IS 'Summary rendered to HTML (markdown with bullet normalization)';
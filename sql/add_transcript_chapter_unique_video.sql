@@ -0,0 +1,21 @@
+-- One transcript and one chapters row per video
+-- Copy and paste these commands into your Supabase SQL Editor
+-- Lets the app upsert transcripts and chapters on video_id instead of
+-- deleting and re-inserting them.
+
+-- Keep only the most recently updated row per video before adding the constraints
+DELETE FROM transcripts t
+USING transcripts newer
+WHERE t.video_id = newer.video_id
+  AND (COALESCE(t.updated_at, 'epoch'), t.id) < (COALESCE(newer.updated_at, 'epoch'), newer.id);
+
+DELETE FROM video_chapters c
+USING video_chapters newer
+WHERE c.video_id = newer.video_id
+  AND (COALESCE(c.updated_at, 'epoch'), c.id) < (COALESCE(newer.updated_at, 'epoch'), newer.id);
+
+ALTER TABLE transcripts DROP CONSTRAINT IF EXISTS transcripts_video_id_key;
+ALTER TABLE transcripts ADD CONSTRAINT transcripts_video_id_key UNIQUE (video_id);
+
+ALTER TABLE video_chapters DROP CONSTRAINT IF EXISTS video_chapters_video_id_key;
+ALTER TABLE video_chapters ADD CONSTRAINT video_chapters_video_id_key UNIQUE (video_id);
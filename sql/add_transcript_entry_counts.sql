@@ -0,0 +1,41 @@
+-- Store transcript entry and chapter counts alongside the JSON
+-- Copy and paste these commands into your Supabase SQL Editor (PostgreSQL 12+)
+-- Run after create_video_list_stats_view.sql.
+--
+-- WARNING: adding a STORED generated column rewrites the whole table under an
+-- ACCESS EXCLUSIVE lock. transcripts and video_chapters can't be read or written
+-- until each ALTER finishes, and with large transcript tables that can take
+-- minutes. Run it during a quiet period, or set a lock_timeout first so it fails
+-- fast instead of queueing behind long requests:
+--   SET lock_timeout = '5s';
+
+-- Generated columns are computed once when a row is written, so video listings
+-- read two integers instead of detoasting every transcript to count entries.
+ALTER TABLE transcripts
+ADD COLUMN IF NOT EXISTS transcript_entries INTEGER
+GENERATED ALWAYS AS (
+    CASE WHEN jsonb_typeof(transcript_data) = 'array' THEN jsonb_array_length(transcript_data) ELSE 0 END
+) STORED;
+
+ALTER TABLE video_chapters
+ADD COLUMN IF NOT EXISTS chapters_count INTEGER
+GENERATED ALWAYS AS (
+    CASE WHEN jsonb_typeof(chapters_data) = 'array' THEN jsonb_array_length(chapters_data) ELSE 0 END
+) STORED;
+
+-- Same columns as before, now reading the stored counts
+CREATE OR REPLACE VIEW video_list_stats AS
+SELECT
+    v.video_id,
+    v.title,
+    v.channel_id,
+    v.duration,
+    v.created_at,
+    v.published_at,
+    v.url_path,
+    COALESCE(t.transcript_entries, 0) AS transcript_entries,
+    COALESCE(c.chapters_count, 0) AS chapters_count,
+    EXISTS (SELECT 1 FROM summaries s WHERE s.video_id = v.video_id) AS has_summary
+FROM youtube_videos v
+LEFT JOIN transcripts t ON t.video_id = v.video_id
+LEFT JOIN video_chapters c ON c.video_id = v.video_id;
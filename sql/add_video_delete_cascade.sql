@@ -0,0 +1,17 @@
+-- Cascade video deletes to transcripts, chapters and summaries
+-- Copy and paste these commands into your Supabase SQL Editor
+-- create_tables.sql already declares these foreign keys with ON DELETE CASCADE;
+-- run this on databases created before that so deleting a youtube_videos row
+-- removes its dependent rows in the same statement.
+
+ALTER TABLE transcripts DROP CONSTRAINT IF EXISTS transcripts_video_id_fkey;
+ALTER TABLE transcripts ADD CONSTRAINT transcripts_video_id_fkey
+FOREIGN KEY (video_id) REFERENCES youtube_videos(video_id) ON DELETE CASCADE;
+
+ALTER TABLE video_chapters DROP CONSTRAINT IF EXISTS video_chapters_video_id_fkey;
+ALTER TABLE video_chapters ADD CONSTRAINT video_chapters_video_id_fkey
+FOREIGN KEY (video_id) REFERENCES youtube_videos(video_id) ON DELETE CASCADE;
+
+ALTER TABLE summaries DROP CONSTRAINT IF EXISTS summaries_video_id_fkey;
+ALTER TABLE summaries ADD CONSTRAINT summaries_video_id_fkey
+FOREIGN KEY (video_id) REFERENCES youtube_videos(video_id) ON DELETE CASCADE;
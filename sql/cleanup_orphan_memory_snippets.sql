@@ -0,0 +1,10 @@
+-- OPTIONAL: permanently delete memory snippets whose video no longer exists
+-- Copy and paste these commands into your Supabase SQL Editor
+-- Deleting a video keeps its snippets, so they show up without a title or
+-- channel. This removes them for good; nothing else depends on it, so only run
+-- it if you no longer want those snippets. Review them first with:
+--   SELECT * FROM memory_snippets
+--   WHERE NOT EXISTS (SELECT 1 FROM youtube_videos v WHERE v.video_id = memory_snippets.video_id);
+
+DELETE FROM memory_snippets
+WHERE NOT EXISTS (SELECT 1 FROM youtube_videos v WHERE v.video_id = memory_snippets.video_id);
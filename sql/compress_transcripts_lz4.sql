@@ -0,0 +1,12 @@
+-- Compress large transcript columns with LZ4
+-- Copy and paste these commands into your Supabase SQL Editor (PostgreSQL 14+)
+
+-- Transcript JSON and formatted text are TOASTed once they pass ~2 KB. LZ4
+-- decompresses several times faster than the default pglz, which speeds up
+-- every transcript read, at a similar compression ratio for repetitive text.
+ALTER TABLE transcripts ALTER COLUMN transcript_data SET COMPRESSION lz4;
+ALTER TABLE transcripts ALTER COLUMN formatted_transcript SET COMPRESSION lz4;
+
+-- New compression only applies to values written from now on. To recompress
+-- existing rows, rewrite them once (takes a lock proportional to table size):
+-- UPDATE transcripts SET transcript_data = transcript_data || '[]'::jsonb, formatted_transcript = formatted_transcript || '';
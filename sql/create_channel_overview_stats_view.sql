@@ -0,0 +1,42 @@
+-- Per-channel video and summary counts for the /channels page
+-- Copy and paste these commands into your Supabase SQL Editor
+
+-- One row per channel with a handle and at least one video, with its counts,
+-- newest video date and three most recent videos, so the channels page no
+-- longer downloads every video and summary to aggregate them in Python.
+CREATE OR REPLACE VIEW channel_overview_stats AS
+SELECT
+    c.channel_id,
+    c.channel_name,
+    c.handle,
+    c.thumbnail_url,
+    stats.video_count,
+    stats.summary_count,
+    stats.latest_video_date,
+    recent.recent_videos
+FROM youtube_channels c
+JOIN LATERAL (
+    SELECT
+        COUNT(*) AS video_count,
+        COUNT(*) FILTER (WHERE EXISTS (SELECT 1 FROM summaries s WHERE s.video_id = v.video_id)) AS summary_count,
+        MAX(v.created_at) AS latest_video_date
+    FROM youtube_videos v
+    WHERE v.channel_id = c.channel_id
+) stats ON stats.video_count > 0
+CROSS JOIN LATERAL (
+    SELECT COALESCE(jsonb_agg(jsonb_build_object(
+        'video_id', r.video_id,
+        'title', r.title,
+        'duration', r.duration,
+        'url_path', r.url_path,
+        'has_summary', EXISTS (SELECT 1 FROM summaries s WHERE s.video_id = r.video_id)
+    ) ORDER BY r.created_at DESC), '[]'::jsonb) AS recent_videos
+    FROM (
+        SELECT video_id, title, duration, url_path, created_at
+        FROM youtube_videos v
+        WHERE v.channel_id = c.channel_id
+        ORDER BY created_at DESC
+        LIMIT 3
+    ) r
+) recent
+WHERE c.handle IS NOT NULL;
@@ -0,0 +1,14 @@
+-- Per-channel video counts for the grouped /videos listing
+-- Copy and paste these commands into your Supabase SQL Editor
+
+-- One row per channel that has videos, so the grouped listing can page through
+-- channels without downloading every video's channel_id to count them.
+CREATE OR REPLACE VIEW channel_video_counts AS
+SELECT
+    c.channel_id,
+    c.channel_name,
+    c.handle,
+    COUNT(*) AS video_count
+FROM youtube_videos v
+JOIN youtube_channels c ON c.channel_id = v.channel_id
+GROUP BY c.channel_id, c.channel_name, c.handle;
@@ -0,0 +1,27 @@
+-- Per-video memory snippet statistics for the /snippets overview page
+-- Copy and paste these commands into your Supabase SQL Editor
+
+-- One row per video that has snippets, with its channel and the newest snippet
+-- date, so the app no longer downloads every snippet to count and group them.
+-- Snippets outlive their video, so videos and channels are LEFT JOINed and
+-- deleted videos are listed under 'Unknown Channel'. Video thumbnails are not
+-- stored (the app builds them from video_id), so the view doesn't return one.
+DROP VIEW IF EXISTS memory_snippet_video_stats;
+CREATE VIEW memory_snippet_video_stats AS
+SELECT
+    s.video_id,
+    COALESCE(v.title, 'Video ' || s.video_id) AS title,
+    v.url_path,
+    v.channel_id,
+    COALESCE(c.channel_name, 'Unknown Channel') AS channel_name,
+    c.handle,
+    c.thumbnail_url AS channel_thumbnail_url,
+    s.snippet_count,
+    s.latest_date
+FROM (
+    SELECT video_id, COUNT(*) AS snippet_count, MAX(created_at) AS latest_date
+    FROM memory_snippets
+    GROUP BY video_id
+) s
+LEFT JOIN youtube_videos v ON v.video_id = s.video_id
+LEFT JOIN youtube_channels c ON c.channel_id = v.channel_id;
@@ -17,6 +17,16 @@ CREATE INDEX idx_memory_snippets_video_id ON memory_snippets(video_id);
 CREATE INDEX idx_memory_snippets_created_at ON memory_snippets(created_at DESC);
 CREATE INDEX idx_memory_snippets_tags ON memory_snippets USING GIN(tags);
 
+-- Let snippet listings embed their video and channel in one query. Snippets are
+-- kept when their video is deleted, so this is a PostgREST computed relationship
+-- rather than a foreign key (same as sql/add_memory_snippets_indexes.sql)
+CREATE OR REPLACE FUNCTION youtube_videos(memory_snippets)
+RETURNS SETOF youtube_videos ROWS 1
+LANGUAGE sql STABLE
+AS $$
+    SELECT * FROM youtube_videos WHERE video_id = $1.video_id
+$$;
+
 -- Enable Row Level Security
 ALTER TABLE memory_snippets ENABLE ROW LEVEL SECURITY;
 
@@ -0,0 +1,42 @@
+-- Save a video with its transcript and chapters in one call
+-- Copy and paste these commands into your Supabase SQL Editor
+-- Requires add_transcript_chapter_unique_video.sql (unique video_id on
+-- transcripts and video_chapters) for the ON CONFLICT targets.
+
+-- The app calls this through PostgREST's /rpc endpoint, so saving a video is
+-- one round trip and one transaction instead of three separate upserts.
+CREATE OR REPLACE FUNCTION save_video_bundle(p_video JSONB, p_transcript JSONB, p_chapters JSONB DEFAULT NULL)
+RETURNS VOID
+LANGUAGE plpgsql
+AS $$
+BEGIN
+    INSERT INTO youtube_videos (video_id, title, channel_id, duration, published_at, url_path, updated_at)
+    SELECT video_id, title, channel_id, duration, published_at, url_path, updated_at
+    FROM jsonb_populate_record(NULL::youtube_videos, p_video)
+    ON CONFLICT (video_id) DO UPDATE SET
+        title = EXCLUDED.title,
+        channel_id = EXCLUDED.channel_id,
+        duration = EXCLUDED.duration,
+        published_at = EXCLUDED.published_at,
+        url_path = EXCLUDED.url_path,
+        updated_at = EXCLUDED.updated_at;
+
+    INSERT INTO transcripts (video_id, transcript_data, formatted_transcript, language_used, updated_at)
+    SELECT video_id, transcript_data, formatted_transcript, language_used, updated_at
+    FROM jsonb_populate_record(NULL::transcripts, p_transcript)
+    ON CONFLICT (video_id) DO UPDATE SET
+        transcript_data = EXCLUDED.transcript_data,
+        formatted_transcript = EXCLUDED.formatted_transcript,
+        language_used = EXCLUDED.language_used,
+        updated_at = EXCLUDED.updated_at;
+
+    IF p_chapters IS NOT NULL THEN
+        INSERT INTO video_chapters (video_id, chapters_data, updated_at)
+        SELECT video_id, chapters_data, updated_at
+        FROM jsonb_populate_record(NULL::video_chapters, p_chapters)
+        ON CONFLICT (video_id) DO UPDATE SET
+            chapters_data = EXCLUDED.chapters_data,
+            updated_at = EXCLUDED.updated_at;
+    END IF;
+END;
+$$;
@@ -31,7 +31,7 @@ CREATE TABLE IF NOT EXISTS youtube_videos (
 -- Table for storing video transcripts
 CREATE TABLE IF NOT EXISTS transcripts (
     id UUID DEFAULT gen_random_uuid() PRIMARY KEY,
-    video_id VARCHAR(11) NOT NULL REFERENCES youtube_videos(video_id) ON DELETE CASCADE,
+    video_id VARCHAR(11) NOT NULL UNIQUE REFERENCES youtube_videos(video_id) ON DELETE CASCADE,
     transcript_data JSONB NOT NULL, -- Raw transcript with timestamps
     formatted_transcript TEXT NOT NULL, -- Formatted readable transcript
     language_used VARCHAR(10),
@@ -42,7 +42,7 @@ CREATE TABLE IF NOT EXISTS transcripts (
 -- Table for storing video chapters
 CREATE TABLE IF NOT EXISTS video_chapters (
     id UUID DEFAULT gen_random_uuid() PRIMARY KEY,
-    video_id VARCHAR(11) NOT NULL REFERENCES youtube_videos(video_id) ON DELETE CASCADE,
+    video_id VARCHAR(11) NOT NULL UNIQUE REFERENCES youtube_videos(video_id) ON DELETE CASCADE,
     chapters_data JSONB, -- Array of chapter objects
     created_at TIMESTAMP WITH TIME ZONE DEFAULT NOW(),
     updated_at TIMESTAMP WITH TIME ZONE DEFAULT NOW()
@@ -87,6 +87,9 @@ CREATE INDEX IF NOT EXISTS idx_summaries_created_at ON summaries(created_at DESC
 CREATE INDEX IF NOT EXISTS idx_memory_snippets_created_at ON memory_snippets(created_at DESC);
 CREATE INDEX IF NOT EXISTS idx_memory_snippets_tags ON memory_snippets USING GIN(tags);
 CREATE INDEX IF NOT EXISTS idx_youtube_videos_url_path ON youtube_videos(url_path);
+CREATE INDEX IF NOT EXISTS idx_youtube_channels_handle ON youtube_channels(handle);
+CREATE INDEX IF NOT EXISTS idx_youtube_videos_channel_published ON youtube_videos(channel_id, published_at DESC);
+CREATE INDEX IF NOT EXISTS idx_youtube_videos_channel_created ON youtube_videos(channel_id, created_at DESC);
 
 -- Enable Row Level Security (RLS) for better security
 ALTER TABLE youtube_channels ENABLE ROW LEVEL SECURITY;
@@ -0,0 +1,22 @@
+-- Per-video counts for the /videos listing
+-- Copy and paste these commands into your Supabase SQL Editor
+
+-- Transcript entry and chapter counts are computed in the database, so listing
+-- videos no longer downloads every transcript just to count its entries.
+CREATE OR REPLACE VIEW video_list_stats AS
+SELECT
+    v.video_id,
+    v.title,
+    v.channel_id,
+    v.duration,
+    v.created_at,
+    v.published_at,
+    v.url_path,
+    CASE WHEN jsonb_typeof(t.transcript_data) = 'array'
+         THEN jsonb_array_length(t.transcript_data) ELSE 0 END AS transcript_entries,
+    CASE WHEN jsonb_typeof(c.chapters_data) = 'array'
+         THEN jsonb_array_length(c.chapters_data) ELSE 0 END AS chapters_count,
+    EXISTS (SELECT 1 FROM summaries s WHERE s.video_id = v.video_id) AS has_summary
+FROM youtube_videos v
+LEFT JOIN transcripts t ON t.video_id = v.video_id
+LEFT JOIN video_chapters c ON c.video_id = v.video_id;
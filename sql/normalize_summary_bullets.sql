@@ -0,0 +1,7 @@
+-- Normalize "• " bullets in stored summaries to markdown list items
+-- New summaries are normalized when saved; run this once for existing rows.
+-- Matches the rewrite done by normalize_summary_bullets() in src/utils/helpers.py.
+
+UPDATE summaries
+SET summary_text = regexp_replace(summary_text, '^([ \t]*)•\s', '\1* ', 'gn')
+WHERE summary_text LIKE '%•%';
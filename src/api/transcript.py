@@ -5,86 +5,98 @@ Handles transcript-specific operations only
 from flask import request, jsonify
 from ..youtube_api import youtube_api
 from ..database_storage import database_storage
-from ..video_processing import video_processor
+from ..video_processing import video_processor, io_pool
+from ..utils.helpers import stream_json_response, compute_etag
 
 
 def transcript_only(video_id):
     """API endpoint to get/extract transcript only"""
-    try:
-        # Check for extract_transcript parameter
-        extract_transcript = request.args.get('extract_transcript', 'false').lower() == 'true'
+    # Check for extract_transcript parameter
+    extract_transcript = request.args.get('extract_transcript', 'false').lower() == 'true'
+    
+    # Check database first
+    cached_data = database_storage.get(video_id)
+    
+    # If extract_transcript is True, or if we have cached data but no transcript, force re-extraction
+    needs_extraction = (
+        extract_transcript or 
+        not cached_data or 
+        not cached_data.get('transcript') or 
+        len(cached_data.get('transcript', [])) == 0 or
+        cached_data.get('formatted_transcript') == "Transcript extraction is disabled in import settings."
+    )
+    
+    etag = None
+    if cached_data and not needs_extraction:
+        # The stored transcript only changes when it is re-extracted
+        etag = compute_etag(video_id, cached_data.get('updated_at'))
+        if etag and request.if_none_match.contains_weak(etag):
+            return '', 304
         
-        # Check database first
-        cached_data = database_storage.get(video_id)
+        print(f"API: Using cached transcript for video: {video_id}")
+        transcript = cached_data['transcript']
+        video_info = cached_data['video_info']
+        formatted_transcript = cached_data['formatted_transcript']
+    else:
+        if extract_transcript:
+            print(f"API: Extracting transcript for video: {video_id}")
+        else:
+            print(f"API: No transcript found for video: {video_id}, extracting")
         
-        # If extract_transcript is True, or if we have cached data but no transcript, force re-extraction
-        needs_extraction = (
-            extract_transcript or 
-            not cached_data or 
-            not cached_data.get('transcript') or 
-            len(cached_data.get('transcript', [])) == 0 or
-            cached_data.get('formatted_transcript') == "Transcript extraction is disabled in import settings."
-        )
+        # Fetch video info alongside the transcript; the two YouTube requests are independent
+        video_info_future = io_pool.submit(youtube_api.get_video_info, video_id)
         
-        if cached_data and not needs_extraction:
-            print(f"API: Using cached transcript for video: {video_id}")
-            transcript = cached_data['transcript']
-            video_info = cached_data['video_info']
-            formatted_transcript = cached_data['formatted_transcript']
-        else:
-            if extract_transcript:
-                print(f"API: Extracting transcript for video: {video_id}")
-            else:
-                print(f"API: No transcript found for video: {video_id}, extracting")
-            
-            # Extract transcript only
+        # Extract transcript only
+        try:
             try:
                 transcript = video_processor.get_transcript(video_id)
-                
-                # Format transcript  
-                formatted_transcript = video_processor.transcript_formatter.format_for_readability(transcript, None)
-                
-                # Get minimal video info (just for metadata)
-                try:
-                    video_info = youtube_api.get_video_info(video_id)
-                    if not video_info:
-                        video_info = {'title': 'Unknown Title'}
-                except Exception:
+            except Exception:
+                video_info_future.cancel()
+                raise
+            
+            # Format transcript  
+            formatted_transcript = video_processor.transcript_formatter.format_for_readability(transcript, None)
+            
+            # Get minimal video info (just for metadata)
+            try:
+                video_info = video_info_future.result()
+                if not video_info:
                     video_info = {'title': 'Unknown Title'}
+            except Exception:
+                video_info = {'title': 'Unknown Title'}
+            
+            # Update existing video data with transcript only
+            if cached_data:
+                # Update existing entry with new transcript data
+                existing_video_info = cached_data['video_info']
+                existing_video_info.update(video_info)  # Merge any new metadata
                 
-                # Update existing video data with transcript only
-                if cached_data:
-                    # Update existing entry with new transcript data
-                    existing_video_info = cached_data['video_info']
-                    existing_video_info.update(video_info)  # Merge any new metadata
-                    
-                    # Get existing channel info to avoid re-fetching
-                    channel_id = existing_video_info.get('channel_id')
-                    existing_channel_info = existing_video_info.get('youtube_channels')
-                    
-                    database_storage.set(video_id, transcript, existing_video_info, formatted_transcript, channel_id, existing_channel_info)
-                else:
-                    # New video, minimal setup
-                    channel_id = video_info.get('channel_id')
-                    database_storage.set(video_id, transcript, video_info, formatted_transcript, channel_id, None)
+                # Get existing channel info to avoid re-fetching
+                channel_id = existing_video_info.get('channel_id')
+                existing_channel_info = existing_video_info.get('youtube_channels')
                 
-            except Exception as e:
-                return jsonify({
-                    'success': False,
-                    'error': f"Failed to extract transcript: {str(e)}"
-                }), 500
-        
-        return jsonify({
-            'success': True,
-            'video_id': video_id,
-            'transcript': transcript,
-            'transcript_count': len(transcript) if transcript else 0,
-            'formatted_transcript': formatted_transcript,
-            'video_title': video_info.get('title') if 'video_info' in locals() else None
-        })
-        
-    except Exception as e:
-        return jsonify({
-            'success': False,
-            'error': str(e)
-        }), 500
\ No newline at end of file
+                database_storage.set(video_id, transcript, existing_video_info, formatted_transcript, channel_id, existing_channel_info)
+            else:
+                # New video, minimal setup
+                channel_id = video_info.get('channel_id')
+                database_storage.set(video_id, transcript, video_info, formatted_transcript, channel_id, None)
+            
+        except Exception as e:
+            return jsonify({
+                'success': False,
+                'error': f"Failed to extract transcript: {str(e)}"
+            }), 500
+    
+    # Stream the transcript entries so long videos aren't encoded into one large string
+    response = stream_json_response({
+        'success': True,
+        'video_id': video_id,
+        'transcript_count': len(transcript) if transcript else 0,
+        'formatted_transcript': formatted_transcript,
+        'video_title': video_info.get('title') if 'video_info' in locals() else None
+    }, 'transcript', transcript or [], batch_size=500)
+    if etag:
+        response.set_etag(etag, weak=True)
+        response.cache_control.public = True
+        response.cache_control.max_age = 60
+    return response
\ No newline at end of file
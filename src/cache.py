@@ -0,0 +1,157 @@
+"""
+Redis read-through cache for YouTube Deep Summary
+
+Caches hot database reads (video data, summaries, channel video lists and memory
+snippets) in Redis when REDIS_URL is configured. Without redis installed or
+configured every call is a no-op and reads go straight to the database.
+"""
+import json
+import threading
+from typing import Any, Callable, Optional
+from .config import Config
+
+try:
+    import redis
+    REDIS_AVAILABLE = True
+except ImportError:
+    REDIS_AVAILABLE = False
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+class RedisCache:
+    """Small JSON cache on top of a pooled Redis connection"""
+
+    def __init__(self, url: str = None, ttl: int = None):
+        self.ttl = ttl or Config.CACHE_TTL
+        self.client = None
+
+        url = url or Config.REDIS_URL
+        if not url or not REDIS_AVAILABLE:
+            return
+
+        try:
+            pool = redis.ConnectionPool.from_url(url, socket_timeout=0.5, socket_connect_timeout=0.5)
+            self.client = redis.Redis(connection_pool=pool)
+        except Exception as e:
+            print(f"Redis cache disabled: {e}")
+            self.client = None
+
+    @property
+    def enabled(self) -> bool:
+        """Whether reads and writes are sent to Redis"""
+        return self.client is not None
+
+    def get_json(self, key: str) -> Optional[Any]:
+        """
+        Read a cached value
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Decoded value or None on a miss or Redis error
+        """
+        if not self.client:
+            return None
+        try:
+            data = self.client.get(key)
+        except Exception as e:
+            print(f"Redis read error for {key}: {e}")
+            return None
+        if data is None:
+            return None
+        return orjson.loads(data) if ORJSON_AVAILABLE else json.loads(data)
+
+    def set_json(self, key: str, value: Any, ttl: int = None):
+        """
+        Store a value with an expiry; None values are never cached
+
+        Args:
+            key: Cache key
+            value: JSON-serializable value
+            ttl: Expiry in seconds (defaults to CACHE_TTL)
+        """
+        if not self.client or value is None:
+            return
+        try:
+            data = orjson.dumps(value) if ORJSON_AVAILABLE else json.dumps(value, default=str)
+            self.client.setex(key, ttl or self.ttl, data)
+        except Exception as e:
+            print(f"Redis write error for {key}: {e}")
+
+    def delete(self, *keys: str):
+        """Remove one or more keys"""
+        if not self.client or not keys:
+            return
+        try:
+            self.client.delete(*keys)
+        except Exception as e:
+            print(f"Redis delete error for {keys}: {e}")
+
+    def publish(self, channel: str, message: str):
+        """Send a message to every process subscribed to channel"""
+        if not self.client:
+            return
+        try:
+            self.client.publish(channel, message)
+        except Exception as e:
+            print(f"Redis publish error for {channel}: {e}")
+
+    def subscribe(self, channel: str, callback: Callable[[str], None]) -> Optional[threading.Event]:
+        """
+        Call callback with each message published on channel, from a background thread
+
+        Args:
+            channel: Pub/sub channel name
+            callback: Called with the decoded message text
+
+        Returns:
+            Event that stops the listener and closes its connection when set,
+            or None without Redis
+        """
+        if not self.client:
+            return None
+
+        stop = threading.Event()
+
+        def listen():
+            while not stop.is_set():
+                pubsub = None
+                try:
+                    pubsub = self.client.pubsub(ignore_subscribe_messages=True)
+                    pubsub.subscribe(channel)
+                    while not stop.is_set():
+                        # Polls with its own timeout, so the short socket timeout doesn't apply
+                        message = pubsub.get_message(timeout=1.0)
+                        if message:
+                            data = message['data']
+                            callback(data.decode() if isinstance(data, bytes) else data)
+                except Exception as e:
+                    print(f"Redis subscription to {channel} lost, retrying: {e}")
+                    stop.wait(5)
+                finally:
+                    if pubsub is not None:
+                        pubsub.close()
+
+        threading.Thread(target=listen, name=f"redis-sub-{channel}", daemon=True).start()
+        return stop
+
+    def delete_pattern(self, pattern: str):
+        """Remove every key matching a glob pattern (e.g. 'snips:*')"""
+        if not self.client:
+            return
+        try:
+            keys = list(self.client.scan_iter(match=pattern, count=500))
+            if keys:
+                self.client.delete(*keys)
+        except Exception as e:
+            print(f"Redis delete error for {pattern}: {e}")
+
+
+# Global cache instance
+redis_cache = RedisCache()
@@ -5,9 +5,10 @@ YouTube Chapter Extractor
 A module that handles chapter extraction from YouTube videos using yt-dlp.
 """
 
-import os
 import re
 from typing import List, Dict, Optional
+from .config import Config
+from .utils.ttl_cache import TTLCache
 
 
 class ChapterExtractor:
@@ -15,7 +16,9 @@ class ChapterExtractor:
     
     def __init__(self):
         """Initialize the chapter extractor with proxy configuration"""
-        self.proxy = os.getenv('YOUTUBE_PROXY')
+        self.proxy = Config.YOUTUBE_PROXY
+        # Recent results, including "no chapters", so one video never runs yt-dlp twice at once
+        self._chapters_cache = TTLCache(maxsize=4096, ttl=300, cache_none=True)
     
     def extract_chapters(self, video_id: str) -> Optional[List[Dict]]:
         """
@@ -27,44 +30,9 @@ class ChapterExtractor:
         Returns:
             List of chapters or None if no chapters found
         """
+        # Errors propagate out of the loader, so only a real "no chapters" result is cached
         try:
-            import yt_dlp
-            print(f"Extracting chapters using yt-dlp for {video_id}")
-            
-            # Configure yt-dlp options for chapter extraction only
-            ydl_opts = {
-                'quiet': True,
-                'no_warnings': True,
-                'extract_flat': False,
-            }
-            
-            # Add proxy configuration if available
-            if self.proxy:
-                ydl_opts['proxy'] = f'http://{self.proxy}'
-                print(f"Using proxy for yt-dlp chapter extraction: {self.proxy}")
-            
-            with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-                video_info = ydl.extract_info(
-                    f'https://www.youtube.com/watch?v={video_id}', 
-                    download=False
-                )
-                
-                # Extract and format chapters
-                chapters = video_info.get('chapters', [])
-                if chapters:
-                    formatted_chapters = []
-                    for chapter in chapters:
-                        formatted_chapters.append({
-                            'title': chapter.get('title', 'Unknown Chapter'),
-                            'time': chapter.get('start_time', 0)
-                        })
-                    
-                    # Validate and clean chapters
-                    video_duration = video_info.get('duration')
-                    return self.validate_chapters(formatted_chapters, video_duration)
-                
-                return None
-                
+            return self._chapters_cache.get_or_load(video_id, lambda: self._extract_chapters_with_ytdlp(video_id))
         except ImportError:
             print("yt-dlp not available for chapter extraction")
             return None
@@ -72,6 +40,45 @@ class ChapterExtractor:
             print(f"Error extracting chapters with yt-dlp for {video_id}: {e}")
             return None
     
+    def _extract_chapters_with_ytdlp(self, video_id: str) -> Optional[List[Dict]]:
+        """Run yt-dlp to read the chapter list of a video; raises on extraction errors"""
+        import yt_dlp
+        print(f"Extracting chapters using yt-dlp for {video_id}")
+            
+        # Configure yt-dlp options for chapter extraction only
+        ydl_opts = {
+            'quiet': True,
+            'no_warnings': True,
+            'extract_flat': False,
+        }
+        
+        # Add proxy configuration if available
+        if self.proxy:
+            ydl_opts['proxy'] = f'http://{self.proxy}'
+            print(f"Using proxy for yt-dlp chapter extraction: {self.proxy}")
+        
+        with yt_dlp.YoutubeDL(ydl_opts) as ydl:
+            video_info = ydl.extract_info(
+                f'https://www.youtube.com/watch?v={video_id}', 
+                download=False
+            )
+            
+            # Extract and format chapters
+            chapters = video_info.get('chapters', [])
+            if chapters:
+                formatted_chapters = []
+                for chapter in chapters:
+                    formatted_chapters.append({
+                        'title': chapter.get('title', 'Unknown Chapter'),
+                        'time': chapter.get('start_time', 0)
+                    })
+                
+                # Validate and clean chapters
+                video_duration = video_info.get('duration')
+                return self.validate_chapters(formatted_chapters, video_duration)
+            
+            return None
+    
     def parse_chapters_from_description(self, description: str) -> Optional[List[Dict]]:
         """
         Parse chapters from video description text
@@ -15,6 +15,12 @@ class Config:
     FLASK_PORT = int(os.getenv('FLASK_PORT', 33079))
     FLASK_DEBUG = os.getenv('FLASK_DEBUG', 'True').lower() == 'true'
     
+    # Browser cache lifetime for files served from /static (seconds)
+    STATIC_MAX_AGE = int(os.getenv('STATIC_MAX_AGE', 7 * 24 * 3600))
+    
+    # Logging configuration (DEBUG enables per-request diagnostics)
+    LOG_LEVEL = os.getenv('LOG_LEVEL', 'WARNING').upper()
+    
     # OpenAI configuration
     OPENAI_API_KEY = os.getenv('OPENAI_API_KEY')
     OPENAI_MODEL = os.getenv('OPENAI_MODEL', 'gpt-4.1')
@@ -33,6 +39,10 @@ class Config:
     YOUTUBE_API_KEY = os.getenv('YOUTUBE_API_KEY')
     YOUTUBE_PROXY = os.getenv('YOUTUBE_PROXY')
     
+    # Redis cache configuration (caching is disabled when REDIS_URL is unset)
+    REDIS_URL = os.getenv('REDIS_URL')
+    CACHE_TTL = int(os.getenv('CACHE_TTL', 300))
+    
     @classmethod
     def is_openai_configured(cls):
         """Check if OpenAI API is configured"""
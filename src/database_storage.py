@@ -5,34 +5,147 @@ Replaces the legacy file-based storage system (legacy_file_storage.py)
 """
 
 import os
+import random
+import sys
 import time
+import threading
+import logging
 import re
 import unicodedata
 from typing import Optional, Dict, List
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
+import httpx
 from supabase import create_client, Client
+from postgrest.exceptions import APIError
+from postgrest.types import ReturnMethod
+from postgrest.utils import SyncClient
 from dotenv import load_dotenv
+from .utils.helpers import format_summary_html, normalize_summary_bullets, youtube_thumbnail_url
+from .cache import redis_cache
+from .utils.ttl_cache import TTLCache
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 # Load environment variables
 load_dotenv()
 
+logger = logging.getLogger(__name__)
+
+# datetime.fromisoformat accepts "Z" and 1-6 digit fractions from Python 3.11
+_FULL_ISOFORMAT = sys.version_info >= (3, 11)
+_FRACTION_RE = re.compile(r'\.(\d{1,6})(?=[+-]|$)')
+
+# Runs independent PostgREST requests in parallel (each one is a network round-trip)
+_db_pool = ThreadPoolExecutor(max_workers=8, thread_name_prefix='db-io')
+
+
+def _embedded_rows(value) -> List[Dict]:
+    """
+    Normalize an embedded resource to a list of rows
+
+    PostgREST returns a one-to-one embed (e.g. transcripts once video_id is unique)
+    as a single object or null, and a one-to-many embed as a list.
+    """
+    if not value:
+        return []
+    if isinstance(value, dict):
+        return [value]
+    return value
+
+
+class _ORJSONResponse(httpx.Response):
+    """httpx response whose json() parses with orjson"""
+
+    def json(self, **kwargs):
+        return orjson.loads(self.content)
+
+
+class _PostgrestSession(SyncClient):
+    """
+    PostgREST session that retries transient failures and, when orjson is
+    installed, encodes request bodies and decodes responses with it
+    """
+
+    # Retries after the first attempt, and the base backoff delay in seconds
+    RETRIES = 2
+    BACKOFF = 0.2
+
+    # Statuses returned by Supabase's gateway/pooler while it is briefly unavailable
+    RETRY_STATUSES = {502, 503, 504}
+
+    # Errors raised before the request reached the server, safe to retry for any method
+    CONNECT_ERRORS = (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout)
+
+    def request(self, method, url, *, json=None, **kwargs):
+        if json is not None and ORJSON_AVAILABLE:
+            kwargs['content'] = orjson.dumps(json)
+        return super().request(method, url, **kwargs)
+
+    def send(self, request, **kwargs):
+        # Inserts (POST) are only retried when they never reached the server
+        idempotent = request.method != 'POST'
+        for attempt in range(self.RETRIES + 1):
+            last_attempt = attempt == self.RETRIES
+            try:
+                response = super().send(request, **kwargs)
+            except self.CONNECT_ERRORS as e:
+                if last_attempt:
+                    raise
+                print(f"Database request failed ({e!r}), retrying")
+            except httpx.TimeoutException:
+                # A read/write timeout already used the full timeout; retrying would
+                # hold the worker thread for a multiple of it
+                raise
+            except httpx.TransportError as e:
+                if last_attempt or not idempotent:
+                    raise
+                print(f"Database request failed ({e!r}), retrying")
+            else:
+                if last_attempt or not idempotent or response.status_code not in self.RETRY_STATUSES:
+                    if ORJSON_AVAILABLE:
+                        response.__class__ = _ORJSONResponse
+                    return response
+                response.close()
+                print(f"Database returned {response.status_code}, retrying")
+            time.sleep(self.BACKOFF * (2 ** attempt) + random.uniform(0, self.BACKOFF))
+
 
 class DatabaseStorage:
     """Supabase database storage for YouTube transcripts, summaries, and metadata"""
 
+    # Columns loaded for a video page: the video row plus its transcript and chapters
+    VIDEO_DETAIL_SELECT = ('video_id, title, duration, channel_id, created_at, '
+                           'transcripts(transcript_data, formatted_transcript, updated_at), video_chapters(chapters_data)')
+
+    # Columns loaded for video listings (summaries only need to exist, not their text)
+    VIDEO_LIST_SELECT = ('video_id, title, channel_id, duration, created_at, published_at, url_path, '
+                         'transcripts(transcript_data), summaries(summary_id), video_chapters(chapters_data)')
+
+    # Columns loaded for a channel's video list (thumbnails are derived from video_id)
+    CHANNEL_VIDEO_SELECT = 'video_id, title, channel_id, duration, published_at, created_at, url_path'
+
+    # Redis pub/sub channel announcing video and summary writes to other workers
+    CACHE_INVALIDATION_CHANNEL = 'cache-invalidate'
+
+    # Maximum IDs per .in_() filter, keeps request URLs well under PostgREST limits
+    IN_BATCH_SIZE = 200
+
     def _parse_datetime(self, datetime_str: str) -> datetime:
         """Parse datetime string with variable microsecond precision"""
+        if _FULL_ISOFORMAT:
+            # Python 3.11+ parses "Z" and any fraction length natively (in C)
+            return datetime.fromisoformat(datetime_str)
+
         # Replace Z with +00:00 for proper timezone parsing
         datetime_str = datetime_str.replace('Z', '+00:00')
 
-        # Handle variable microsecond precision by padding with zeros if needed
-        if '+' in datetime_str and '.' in datetime_str:
-            timestamp_part, tz_part = datetime_str.rsplit('+', 1)
-            if '.' in timestamp_part:
-                date_part, microsec_part = timestamp_part.rsplit('.', 1)
-                # Pad microseconds to 6 digits
-                microsec_part = microsec_part.ljust(6, '0')
-                datetime_str = f"{date_part}.{microsec_part}+{tz_part}"
+        # Pad the fractional seconds to the 6 digits older fromisoformat requires
+        datetime_str = _FRACTION_RE.sub(lambda m: '.' + m.group(1).ljust(6, '0'), datetime_str, count=1)
 
         return datetime.fromisoformat(datetime_str)
 
@@ -44,27 +157,70 @@ class DatabaseStorage:
         if not self.url or not self.key:
             raise ValueError("SUPABASE_URL and SUPABASE_API_KEY must be set in environment variables")
 
-        # Temporarily clear proxy environment variables for Supabase
-        original_http_proxy = os.environ.pop('HTTP_PROXY', None)
-        original_https_proxy = os.environ.pop('HTTPS_PROXY', None)
-        original_http_proxy_lower = os.environ.pop('http_proxy', None)
-        original_https_proxy_lower = os.environ.pop('https_proxy', None)
-
-        try:
-            # Create Supabase client without any proxy interference
-            self.supabase: Client = create_client(self.url, self.key)
-        finally:
-            # Restore original proxy settings
-            if original_http_proxy:
-                os.environ['HTTP_PROXY'] = original_http_proxy
-            if original_https_proxy:
-                os.environ['HTTPS_PROXY'] = original_https_proxy
-            if original_http_proxy_lower:
-                os.environ['http_proxy'] = original_http_proxy_lower
-            if original_https_proxy_lower:
-                os.environ['https_proxy'] = original_https_proxy_lower
+        # Database requests go through the pooled session, which ignores
+        # HTTP(S)_PROXY environment variables
+        self.supabase: Client = create_client(self.url, self.key)
+        self._use_pooled_postgrest_session()
         print("Database storage initialized with Supabase (no proxy)")
 
+        # Channel rows keyed by handle; every channel page resolves its handle first.
+        # Cleared on channel and video writes, and the short TTL bounds staleness
+        # from writes made by other workers
+        self._channel_handle_cache = TTLCache(maxsize=1024, ttl=60)
+
+        # Whether summaries.summary_html exists (None until first checked)
+        self._summary_html_column = None
+
+        # Whether the video_list_stats view exists (None until first used)
+        self._video_list_view = None
+
+        # Whether the save_video_bundle function exists (None until first used)
+        self._video_bundle_rpc = None
+
+        # Whether transcripts/video_chapters can be upserted on video_id (unique constraint present)
+        self._video_row_upsert = True
+
+        # Row counts shown on /videos and /api/cache/info; cleared on writes, and the
+        # TTL bounds staleness from writes made by other workers
+        self._stats_cache = TTLCache(maxsize=1, ttl=60)
+
+        # Video data and current summaries, cleared on writes like the stats above.
+        # Other workers' writes only reach these caches through Redis, so the TTLs
+        # stay short until listen_for_evictions() is subscribed
+        self._video_cache = TTLCache(maxsize=512, ttl=30)
+        self._summary_cache = TTLCache(maxsize=2048, ttl=10)
+
+        # Set by listen_for_evictions(); stops the Redis eviction listener
+        self._eviction_listener = None
+
+    def _use_pooled_postgrest_session(self):
+        """
+        Give the PostgREST client a larger keep-alive pool
+
+        httpx drops idle connections after 5 seconds by default, so requests spaced
+        a few seconds apart each paid a new TCP+TLS handshake to Supabase. Keep up
+        to 32 HTTP/2 connections alive for a minute instead. Connecting gets its own
+        short timeout so an unreachable database fails fast instead of holding a
+        worker thread for the full read timeout. trust_env=False keeps HTTP(S)_PROXY
+        settings from routing database traffic through a proxy. Transient connection
+        errors and gateway 502/503/504s are retried with jittered backoff. With
+        orjson installed, transcript and chapter JSON is encoded and parsed by
+        orjson rather than the json module.
+        """
+        postgrest = self.supabase.postgrest
+        old_session = postgrest.session
+        postgrest.session = _PostgrestSession(
+            base_url=old_session.base_url,
+            headers=old_session.headers,
+            timeout=httpx.Timeout(old_session.timeout.read, connect=5.0),
+            verify=postgrest.verify,
+            follow_redirects=True,
+            trust_env=False,
+            http2=True,
+            limits=httpx.Limits(max_connections=64, max_keepalive_connections=32, keepalive_expiry=60)
+        )
+        old_session.close()
+
     def _generate_url_slug(self, title: str) -> str:
         """Generate a URL-friendly slug from a video title using only ASCII characters."""
         if not title:
@@ -156,11 +312,12 @@ class DatabaseStorage:
             
             if not existing.data:
                 # Create new channel record
+                now = datetime.now(timezone.utc).isoformat()
                 channel_data = {
                     'channel_id': channel_id,
                     'channel_name': channel_name,
-                    'created_at': datetime.now(timezone.utc).isoformat(),
-                    'updated_at': datetime.now(timezone.utc).isoformat()
+                    'created_at': now,
+                    'updated_at': now
                 }
                 
                 # Add channel info if provided
@@ -168,6 +325,7 @@ class DatabaseStorage:
                     self._add_channel_info_to_data(channel_data, channel_info, channel_name)
                 
                 self.supabase.table('youtube_channels').insert(channel_data).execute()
+                self.clear_channel_cache()
                 print(f"Created new channel: {channel_name} ({channel_id})")
             else:
                 # Update existing channel with new info if provided
@@ -177,6 +335,7 @@ class DatabaseStorage:
                     
                     if len(update_data) > 1:  # More than just updated_at
                         self.supabase.table('youtube_channels').update(update_data).eq('channel_id', channel_id).execute()
+                        self.clear_channel_cache()
                         print(f"Updated channel info for existing channel: {channel_name}")
             
         except Exception as e:
@@ -263,70 +422,145 @@ class DatabaseStorage:
         Returns:
             Cached data dict or None if not found
         """
-        try:
-            # Get video metadata without JOIN to avoid foreign key issues
-            video_response = self.supabase.table('youtube_videos')\
-                .select('*')\
-                .eq('video_id', video_id)\
-                .execute()
+        return self._video_cache.get_or_load(video_id, lambda: self._load_video(video_id))
 
-            if not video_response.data or len(video_response.data) == 0:
-                print(f"Database MISS for video {video_id}")
-                return None
+    def _load_video(self, video_id: str) -> Optional[Dict]:
+        """Load video data from Redis or the database (behind the in-process cache)"""
+        cached = redis_cache.get_json(f"v:{video_id}")
+        if cached is not None:
+            return cached
 
-            video_data = video_response.data[0]
+        cached_data = self.get_many([video_id]).get(video_id)
+        if cached_data is None:
+            logger.debug("Database MISS for video %s", video_id)
+            return None
 
-            # Get transcript
-            transcript_response = self.supabase.table('transcripts').select('*').eq('video_id', video_id).execute()
+        redis_cache.set_json(f"v:{video_id}", cached_data)
+        return cached_data
 
-            if not transcript_response.data or len(transcript_response.data) == 0:
-                print(f"Database MISS - no transcript for video {video_id}")
-                return None
+    def get_many(self, video_ids: List[str]) -> Dict[str, Dict]:
+        """
+        Get cached transcript data for several videos, one query per batch of IDs
 
-            transcript_data = transcript_response.data[0]
+        Args:
+            video_ids: YouTube video IDs
 
-            # Get chapters (optional)
-            chapters_response = self.supabase.table('video_chapters').select('*').eq('video_id', video_id).execute()
-            chapters = chapters_response.data[0].get('chapters_data') if chapters_response.data and len(chapters_response.data) > 0 else None
+        Returns:
+            Dict mapping video ID to the same data get() returns; videos that
+            are missing or have no transcript are left out
+        """
+        results = {}
+        try:
+            for start in range(0, len(video_ids), self.IN_BATCH_SIZE):
+                batch = video_ids[start:start + self.IN_BATCH_SIZE]
 
-            # Get channel information separately to avoid foreign key issues
-            channel_info = None
-            channel_id = video_data.get('channel_id')
-            if channel_id:
+                # Load the videos with their transcript, chapters and channel in one request
                 try:
-                    channel_response = self.supabase.table('youtube_channels')\
-                        .select('channel_name, channel_id, thumbnail_url, handle')\
-                        .eq('channel_id', channel_id)\
+                    video_response = self.supabase.table('youtube_videos')\
+                        .select(self.VIDEO_DETAIL_SELECT + ', youtube_channels(channel_name, channel_id, thumbnail_url, handle)')\
+                        .in_('video_id', batch)\
+                        .execute()
+                except Exception as embed_error:
+                    # Databases without the youtube_videos -> youtube_channels foreign key
+                    print(f"Channel embed unavailable, loading channels separately: {embed_error}")
+                    video_response = self.supabase.table('youtube_videos')\
+                        .select(self.VIDEO_DETAIL_SELECT)\
+                        .in_('video_id', batch)\
                         .execute()
-                    
-                    if channel_response.data and len(channel_response.data) > 0:
-                        channel_info = channel_response.data[0]
-                except Exception as e:
-                    print(f"Warning: Could not fetch channel info for {channel_id}: {e}")
-                    channel_info = None
 
-            # Reconstruct the cache format with enhanced channel information
-            cached_data = {
-                'video_id': video_id,
-                'timestamp': time.mktime(self._parse_datetime(video_data['created_at']).timetuple()),
-                'transcript': transcript_data['transcript_data'],
-                'video_info': {
-                    'title': video_data['title'],
-                    'duration': video_data['duration'],
-                    'chapters': chapters,
-                    'channel_id': video_data.get('channel_id'),
-                    'youtube_channels': channel_info
-                },
-                'formatted_transcript': transcript_data['formatted_transcript']
-            }
+                for row in video_response.data or []:
+                    cached_data = self._build_cached_data(row)
+                    if cached_data:
+                        results[row['video_id']] = cached_data
+
+        except Exception as e:
+            print(f"Database read error for {len(video_ids)} videos: {e}")
+        return results
+
+    def get_with_summary(self, video_id: str) -> tuple:
+        """
+        Get the current summary for a video, loading cached video data only when
+        there is no summary yet
+
+        Args:
+            video_id: YouTube video ID
 
-            print(f"Database HIT for video {video_id}")
-            return cached_data
+        Returns:
+            Tuple of (cached data dict or None, summary text or None). Cached data
+            is only loaded when no current summary exists.
+        """
+        try:
+            video_response = self.supabase.table('youtube_videos')\
+                .select('video_id, summaries(summary_text)')\
+                .eq('video_id', video_id)\
+                .eq('summaries.is_current', True)\
+                .execute()
+
+            if not video_response.data or len(video_response.data) == 0:
+                logger.debug("Database MISS for video %s", video_id)
+                return None, None
+
+            current_summaries = video_response.data[0].get('summaries') or []
+            if current_summaries:
+                return None, current_summaries[0]['summary_text']
+
+            return self.get(video_id), None
 
         except Exception as e:
             print(f"Database read error for {video_id}: {e}")
+            return None, None
+
+    def _build_cached_data(self, video_data: Dict) -> Optional[Dict]:
+        """Build the cache format from a youtube_videos row selected with VIDEO_DETAIL_SELECT"""
+        video_id = video_data['video_id']
+
+        # Embeds come back as lists, or single objects once video_id is unique
+        transcripts = _embedded_rows(video_data.get('transcripts'))
+        if not transcripts:
+            logger.debug("Database MISS - no transcript for video %s", video_id)
             return None
 
+        transcript_data = transcripts[0]
+
+        # Chapters are optional
+        video_chapters = _embedded_rows(video_data.get('video_chapters'))
+        chapters = video_chapters[0].get('chapters_data') if video_chapters else None
+
+        channel_info = video_data.get('youtube_channels')
+        channel_id = video_data.get('channel_id')
+        if 'youtube_channels' not in video_data and channel_id:
+            # The channel couldn't be embedded; look it up directly
+            try:
+                channel_response = self.supabase.table('youtube_channels')\
+                    .select('channel_name, channel_id, thumbnail_url, handle')\
+                    .eq('channel_id', channel_id)\
+                    .execute()
+
+                if channel_response.data:
+                    channel_info = channel_response.data[0]
+            except Exception as e:
+                print(f"Warning: Could not fetch channel info for {channel_id}: {e}")
+                channel_info = None
+
+        # Reconstruct the cache format with enhanced channel information
+        cached_data = {
+            'video_id': video_id,
+            'timestamp': self._parse_datetime(video_data['created_at']).timestamp(),
+            'transcript': transcript_data['transcript_data'],
+            'video_info': {
+                'title': video_data['title'],
+                'duration': video_data['duration'],
+                'chapters': chapters,
+                'channel_id': video_data.get('channel_id'),
+                'youtube_channels': channel_info
+            },
+            'formatted_transcript': transcript_data['formatted_transcript'],
+            'updated_at': transcript_data.get('updated_at')
+        }
+
+        logger.debug("Database HIT for video %s", video_id)
+        return cached_data
+
     def set(self, video_id: str, transcript: List[Dict], video_info: Dict, formatted_transcript: str, channel_id: str = None, channel_info: dict = None):
         """
         Store transcript data for video ID in database
@@ -338,6 +572,9 @@ class DatabaseStorage:
             formatted_transcript: Formatted readable transcript
             channel_id: YouTube channel ID
             channel_info: Channel info dict with handle, title, description
+
+        Returns:
+            The stored data in the same format returned by get()
         """
         try:
             # Handle channel information
@@ -360,58 +597,143 @@ class DatabaseStorage:
             base_slug = self._generate_url_slug(title)
             url_path = self._ensure_unique_url_slug(base_slug, video_id)
 
+            # One timestamp for the video, transcript and chapters rows
+            now = datetime.now(timezone.utc).isoformat()
+
             # Insert or update video metadata
             video_data = {
                 'video_id': video_id,
                 'title': title,
                 'channel_id': channel_id,
                 'duration': video_info.get('duration'),
-                'thumbnail_url': f"https://img.youtube.com/vi/{video_id}/maxresdefault.jpg",
                 'published_at': published_at,
                 'url_path': url_path,
-                'updated_at': datetime.now(timezone.utc).isoformat()
+                'updated_at': now
             }
 
-            # Use upsert to insert or update (on_conflict specifies the unique constraint)
-            self.supabase.table('youtube_videos').upsert(video_data, on_conflict='video_id').execute()
-
             # Insert or update transcript
             transcript_data = {
                 'video_id': video_id,
                 'transcript_data': transcript,
                 'formatted_transcript': formatted_transcript,
                 'language_used': 'en',  # Default, could be enhanced
-                'updated_at': datetime.now(timezone.utc).isoformat()
+                'updated_at': now
             }
 
-            # Delete existing transcript and insert new one
-            self.supabase.table('transcripts').delete().eq('video_id', video_id).execute()
-            self.supabase.table('transcripts').insert(transcript_data).execute()
-
             # Insert or update chapters if available
             chapters = video_info.get('chapters')
-            print(f"Chapters data for {video_id}: {chapters}")
+            logger.debug("Chapters data for %s: %s", video_id, chapters)
+            chapters_data = None
             if chapters:
                 chapters_data = {
                     'video_id': video_id,
                     'chapters_data': chapters,
-                    'updated_at': datetime.now(timezone.utc).isoformat()
+                    'updated_at': now
                 }
 
-                # Delete existing chapters and insert new ones
-                self.supabase.table('video_chapters').delete().eq('video_id', video_id).execute()
-                self.supabase.table('video_chapters').insert(chapters_data).execute()
+            if not self._save_video_bundle(video_data, transcript_data, chapters_data):
+                # Use upsert to insert or update (on_conflict specifies the unique constraint)
+                self.supabase.table('youtube_videos').upsert(video_data, on_conflict='video_id').execute()
+
+                # Transcript and chapters only depend on the video row, so write them in parallel
+                transcript_write = _db_pool.submit(self._replace_video_row, 'transcripts', transcript_data)
+                if chapters_data:
+                    self._replace_video_row('video_chapters', chapters_data)
+                transcript_write.result()
+
+            if chapters:
                 print(f"Chapters saved for {video_id}: {len(chapters)} chapters")
             else:
                 print(f"No chapters found for video {video_id}")
 
             print(f"Database SAVED for video {video_id}")
+            self._invalidate_video_cache(video_id, channel_id)
+
+            return {
+                'video_id': video_id,
+                'timestamp': time.time(),
+                'transcript': transcript,
+                'video_info': {
+                    'title': title,
+                    'duration': video_info.get('duration'),
+                    'chapters': chapters,
+                    'channel_id': channel_id,
+                    'youtube_channels': self._stored_channel_info(channel_id, video_info, channel_info)
+                },
+                'formatted_transcript': formatted_transcript,
+                'updated_at': transcript_data['updated_at']
+            }
 
         except Exception as e:
             print(f"Database write error for {video_id}: {e}")
             raise
 
-    def save_summary(self, video_id: str, summary: str, model_used: str = 'gpt-4.1', prompt_id: int = None, prompt_name: str = None):
+    def _save_video_bundle(self, video_data: Dict, transcript_data: Dict, chapters_data: Optional[Dict]) -> bool:
+        """
+        Write a video with its transcript and chapters in one transaction using the
+        save_video_bundle function (sql/create_save_video_bundle_function.sql)
+
+        Args:
+            video_data: youtube_videos row
+            transcript_data: transcripts row
+            chapters_data: video_chapters row, or None when the video has no chapters
+
+        Returns:
+            True if saved, False if the function is missing or can't run on this schema
+        """
+        if self._video_bundle_rpc is False:
+            return False
+        try:
+            self.supabase.rpc('save_video_bundle', {
+                'p_video': video_data,
+                'p_transcript': transcript_data,
+                'p_chapters': chapters_data
+            }).execute()
+        except APIError as e:
+            # PGRST202: function not found in the schema cache; 42P10: no unique
+            # video_id constraint for its ON CONFLICT targets; 42P01: a table it
+            # writes is missing. The transaction rolled back, so the separate
+            # upserts below can take over (and degrade the same way).
+            if e.code not in ('PGRST202', '42P10', '42P01'):
+                raise
+            print(f"save_video_bundle function unusable ({e.code}), saving rows with separate upserts")
+            self._video_bundle_rpc = False
+            return False
+        self._video_bundle_rpc = True
+        return True
+
+    def _replace_video_row(self, table: str, row: Dict):
+        """Replace the single row a video has in a per-video table (transcripts, video_chapters)"""
+        if self._video_row_upsert:
+            try:
+                self.supabase.table(table).upsert(row, on_conflict='video_id').execute()
+                return
+            except Exception as e:
+                # Needs sql/add_transcript_chapter_unique_video.sql for the ON CONFLICT target
+                if 'on conflict' not in str(e).lower():
+                    raise
+                print(f"No unique video_id constraint on {table}, replacing rows with delete + insert")
+                self._video_row_upsert = False
+
+        self.supabase.table(table).delete(returning=ReturnMethod.minimal).eq('video_id', row['video_id']).execute()
+        self.supabase.table(table).insert(row).execute()
+
+    def _stored_channel_info(self, channel_id: str, video_info: Dict, channel_info: dict = None) -> Optional[Dict]:
+        """Build the youtube_channels entry returned by set() without re-reading the video"""
+        if not channel_id:
+            return None
+        if not channel_info:
+            return self.get_channel_by_id(channel_id)
+
+        return {
+            'channel_name': channel_info.get('title') or channel_info.get('channel_name') or video_info.get('channel_name', 'Unknown Channel'),
+            'channel_id': channel_id,
+            'thumbnail_url': channel_info.get('thumbnail_url'),
+            'handle': channel_info.get('handle')
+        }
+
+    def save_summary(self, video_id: str, summary: str, model_used: str = 'gpt-4.1', prompt_id: int = None, prompt_name: str = None,
+                     summary_html: str = None):
         """
         Save AI summary for a video (creates new history entry instead of overwriting)
 
@@ -421,8 +743,12 @@ class DatabaseStorage:
             model_used: AI model used for summary
             prompt_id: ID of the prompt used (optional)
             prompt_name: Name of the prompt used (optional)
+            summary_html: Rendered HTML for the summary (rendered here if not given)
         """
         try:
+            # Store bullets in markdown form so rendering never has to rewrite them
+            summary = normalize_summary_bullets(summary)
+            now = datetime.now(timezone.utc).isoformat()
             summary_data = {
                 'video_id': video_id,
                 'summary_text': summary,
@@ -430,13 +756,20 @@ class DatabaseStorage:
                 'prompt_id': prompt_id,
                 'prompt_name': prompt_name or 'Default Summary',
                 'is_current': True,
-                'created_at': datetime.now(timezone.utc).isoformat(),
-                'updated_at': datetime.now(timezone.utc).isoformat()
+                'created_at': now,
+                'updated_at': now
             }
 
+            # Store the rendered HTML so pages don't re-render the markdown on every view
+            if self._has_summary_html_column():
+                summary_data['summary_html'] = summary_html or format_summary_html(summary)
+
             # Insert new summary (trigger will handle version numbering and current flag management)
             result = self.supabase.table('summaries').insert(summary_data).execute()
 
+            self._evict(video_id, video=False)
+            redis_cache.delete(f"sum:{video_id}")
+
             if result.data:
                 print(f"Summary saved for video {video_id} (version {result.data[0].get('version_number', 'unknown')})")
                 return result.data[0].get('summary_id')
@@ -458,21 +791,268 @@ class DatabaseStorage:
         Returns:
             Summary text or None if not found
         """
+        return self._summary_cache.get_or_load(video_id, lambda: self._load_summary(video_id))
+
+    def _load_summary(self, video_id: str) -> Optional[str]:
+        """Load the current summary from Redis or the database (behind the in-process cache)"""
+        cached = redis_cache.get_json(f"sum:{video_id}")
+        if cached is not None:
+            return cached
+
         try:
             response = self.supabase.table('summaries')\
                 .select('summary_text')\
                 .eq('video_id', video_id)\
                 .eq('is_current', True)\
+                .limit(1)\
                 .execute()
 
             if response.data and len(response.data) > 0:
-                return response.data[0]['summary_text']
+                summary = response.data[0]['summary_text']
+                redis_cache.set_json(f"sum:{video_id}", summary)
+                return summary
             return None
 
         except Exception as e:
             print(f"Error getting summary for {video_id}: {e}")
             return None
 
+    def get_summary_html(self, video_id: str) -> Optional[str]:
+        """
+        Get the current summary for a video rendered as HTML
+
+        The rendered HTML is stored next to the summary text. Summaries saved before
+        the summary_html column existed are rendered once and stored on first read.
+
+        Args:
+            video_id: YouTube video ID
+
+        Returns:
+            Summary HTML or None if not found
+        """
+        if not self._has_summary_html_column():
+            return format_summary_html(self.get_summary(video_id))
+
+        try:
+            response = self.supabase.table('summaries')\
+                .select('summary_id, summary_text, summary_html')\
+                .eq('video_id', video_id)\
+                .eq('is_current', True)\
+                .limit(1)\
+                .execute()
+
+            if not response.data:
+                return None
+
+            row = response.data[0]
+            if row.get('summary_html'):
+                return row['summary_html']
+
+            summary_html = format_summary_html(row['summary_text'])
+            self.save_summary_html(row['summary_id'], summary_html)
+            return summary_html
+
+        except Exception as e:
+            print(f"Error getting summary HTML for {video_id}: {e}")
+            return None
+
+    def save_summary_html(self, summary_id: int, summary_html: str) -> bool:
+        """
+        Store rendered HTML for a summary row
+
+        Args:
+            summary_id: Summary ID
+            summary_html: Rendered summary HTML
+
+        Returns:
+            True if stored
+        """
+        try:
+            self.supabase.table('summaries')\
+                .update({'summary_html': summary_html})\
+                .eq('summary_id', summary_id)\
+                .execute()
+            return True
+
+        except Exception as e:
+            print(f"Error saving summary HTML for summary {summary_id}: {e}")
+            return False
+
+    def videos_present(self, video_ids: List[str]) -> set:
+        """
+        Get which of the given videos are stored with a transcript, in one query per batch
+
+        Matches get(), which treats a video without a transcript row as missing, so
+        partial imports are retried rather than skipped.
+
+        Args:
+            video_ids: YouTube video IDs
+
+        Returns:
+            Set of video IDs that exist in youtube_videos and have a transcript
+        """
+        present = set()
+        try:
+            for start in range(0, len(video_ids), self.IN_BATCH_SIZE):
+                # !inner drops videos without a transcript row on the server
+                response = self.supabase.table('youtube_videos')\
+                    .select('video_id, transcripts!inner(video_id)')\
+                    .in_('video_id', video_ids[start:start + self.IN_BATCH_SIZE])\
+                    .execute()
+                present.update(row['video_id'] for row in response.data or [])
+
+        except Exception as e:
+            print(f"Error checking stored videos for {len(video_ids)} videos: {e}")
+        return present
+
+    def summaries_present(self, video_ids: List[str]) -> set:
+        """
+        Get which of the given videos have a current summary in one query per batch
+
+        Args:
+            video_ids: YouTube video IDs
+
+        Returns:
+            Set of video IDs that have a current summary
+        """
+        present = set()
+        try:
+            for start in range(0, len(video_ids), self.IN_BATCH_SIZE):
+                response = self.supabase.table('summaries')\
+                    .select('video_id')\
+                    .in_('video_id', video_ids[start:start + self.IN_BATCH_SIZE])\
+                    .eq('is_current', True)\
+                    .execute()
+                present.update(row['video_id'] for row in response.data or [])
+
+        except Exception as e:
+            print(f"Error checking summaries for {len(video_ids)} videos: {e}")
+        return present
+
+    def get_summaries(self, video_ids: List[str]) -> Dict[str, str]:
+        """
+        Get the current summary text for many videos in one query per batch
+
+        Args:
+            video_ids: YouTube video IDs
+
+        Returns:
+            Dict mapping video ID to summary text for videos that have a summary
+        """
+        summaries = {}
+        try:
+            for start in range(0, len(video_ids), self.IN_BATCH_SIZE):
+                response = self.supabase.table('summaries')\
+                    .select('video_id, summary_text')\
+                    .in_('video_id', video_ids[start:start + self.IN_BATCH_SIZE])\
+                    .eq('is_current', True)\
+                    .execute()
+                summaries.update((row['video_id'], row['summary_text']) for row in response.data or [])
+
+        except Exception as e:
+            print(f"Error getting summaries for {len(video_ids)} videos: {e}")
+        return summaries
+
+    def channel_has_videos(self, channel_id: str) -> bool:
+        """Check whether a channel has any imported videos (a single-row lookup)"""
+        try:
+            response = self.supabase.table('youtube_videos')\
+                .select('video_id')\
+                .eq('channel_id', channel_id)\
+                .limit(1)\
+                .execute()
+            return bool(response.data)
+        except Exception as e:
+            print(f"Error checking videos for channel {channel_id}: {e}")
+            return False
+
+    def get_channel_summarized_videos(self, channel_id: str) -> List[Dict]:
+        """
+        Get a channel's videos that have a current summary, with the summary text
+
+        Args:
+            channel_id: YouTube channel ID
+
+        Returns:
+            List of video dicts with a 'summary' key, newest published first
+        """
+        try:
+            # !inner drops videos without a current summary on the server
+            response = self.supabase.table('youtube_videos')\
+                .select('video_id, title, channel_id, duration, published_at, url_path, '
+                        'youtube_channels(channel_name, handle), summaries!inner(summary_text)')\
+                .eq('channel_id', channel_id)\
+                .eq('summaries.is_current', True)\
+                .order('published_at', desc=True)\
+                .execute()
+        except Exception as e:
+            print(f"Error getting summarized videos for channel {channel_id}: {e}")
+            return []
+
+        videos = []
+        for video in response.data or []:
+            channel = video.pop('youtube_channels', None) or {}
+            summaries = video.pop('summaries')
+            video['channel_name'] = channel.get('channel_name')
+            video['handle'] = channel.get('handle')
+            video['summary'] = summaries[0]['summary_text']
+            videos.append(video)
+        return videos
+
+    def get_summaries_html(self, video_ids: List[str]) -> Dict[str, str]:
+        """
+        Get the current summaries for many videos rendered as HTML
+
+        Args:
+            video_ids: YouTube video IDs
+
+        Returns:
+            Dict mapping video ID to summary HTML for videos that have a summary
+        """
+        has_html_column = self._has_summary_html_column()
+        columns = 'summary_id, video_id, summary_text, summary_html' if has_html_column else 'video_id, summary_text'
+        summaries = {}
+        rendered = []
+        try:
+            for start in range(0, len(video_ids), self.IN_BATCH_SIZE):
+                response = self.supabase.table('summaries')\
+                    .select(columns)\
+                    .in_('video_id', video_ids[start:start + self.IN_BATCH_SIZE])\
+                    .eq('is_current', True)\
+                    .execute()
+
+                for row in response.data or []:
+                    summary_html = row.get('summary_html')
+                    if not summary_html:
+                        summary_html = format_summary_html(row['summary_text'])
+                        if has_html_column:
+                            rendered.append((row['summary_id'], summary_html))
+                    summaries[row['video_id']] = summary_html
+
+            # Store newly rendered HTML concurrently; each write is a separate round-trip
+            if len(rendered) > 1:
+                list(_db_pool.map(lambda item: self.save_summary_html(*item), rendered))
+            elif rendered:
+                self.save_summary_html(*rendered[0])
+
+        except Exception as e:
+            print(f"Error getting summaries for {len(video_ids)} videos: {e}")
+        return summaries
+
+    def _has_summary_html_column(self) -> bool:
+        """Check once whether the summaries table has the summary_html column"""
+        if self._summary_html_column is None:
+            try:
+                self.supabase.table('summaries').select('summary_html').limit(1).execute()
+                self._summary_html_column = True
+            except Exception as e:
+                if 'summary_html' not in str(e):
+                    print(f"Error checking summary_html column: {e}")
+                    return False
+                print("summary_html column doesn't exist yet, rendering summaries on read")
+                self._summary_html_column = False
+        return self._summary_html_column
+
     def get_summary_history(self, video_id: str) -> List[Dict]:
         """
         Get all summary history for a video
@@ -598,7 +1178,7 @@ class DatabaseStorage:
             try:
                 # Get total video count
                 videos_response = self.supabase.table('youtube_videos')\
-                    .select('video_id', count='exact')\
+                    .select('video_id', count='exact', head=True)\
                     .eq('channel_id', channel_id)\
                     .execute()
                 
@@ -623,7 +1203,7 @@ class DatabaseStorage:
                 
                 # Count summaries
                 summary_response = self.supabase.table('summaries')\
-                    .select('video_id', count='exact')\
+                    .select('video_id', count='exact', head=True)\
                     .in_('video_id', video_ids)\
                     .eq('is_current', True)\
                     .execute()
@@ -632,7 +1212,7 @@ class DatabaseStorage:
                 
                 # Count transcripts  
                 transcript_response = self.supabase.table('transcripts')\
-                    .select('video_id', count='exact')\
+                    .select('video_id', count='exact', head=True)\
                     .in_('video_id', video_ids)\
                     .execute()
                 
@@ -640,7 +1220,7 @@ class DatabaseStorage:
                 
                 # Count snippets
                 snippet_response = self.supabase.table('memory_snippets')\
-                    .select('id', count='exact')\
+                    .select('id', count='exact', head=True)\
                     .in_('video_id', video_ids)\
                     .execute()
                 
@@ -706,6 +1286,8 @@ class DatabaseStorage:
                 .eq('video_id', video_id)\
                 .eq('summary_id', summary_id)\
                 .execute()
+            self._evict(video_id, video=False)
+            redis_cache.delete(f"sum:{video_id}")
 
             return bool(result.data)
 
@@ -729,6 +1311,10 @@ class DatabaseStorage:
                 .eq('summary_id', summary_id)\
                 .execute()
 
+            for row in result.data or []:
+                self._evict(row.get('video_id'), video=False)
+                redis_cache.delete(f"sum:{row.get('video_id')}")
+
             return bool(result.data)
 
         except Exception as e:
@@ -774,6 +1360,7 @@ class DatabaseStorage:
                     .eq('chapter_time', chapter_time)\
                     .execute()
 
+            now = datetime.now(timezone.utc).isoformat()
             chapter_summary_data = {
                 'video_id': video_id,
                 'chapter_time': chapter_time,
@@ -782,8 +1369,8 @@ class DatabaseStorage:
                 'model_used': model_used,
                 'is_current': True,
                 'version_number': next_version,
-                'created_at': datetime.now(timezone.utc).isoformat(),
-                'updated_at': datetime.now(timezone.utc).isoformat()
+                'created_at': now,
+                'updated_at': now
             }
             
             # Add prompt information if provided
@@ -971,20 +1558,55 @@ class DatabaseStorage:
         print("Database storage doesn't expire - keeping all data")
         return
 
-    def get_cache_info(self) -> Dict:
-        """Get database statistics using efficient count queries"""
+    def get_table_version(self, table: str) -> tuple:
+        """
+        Get a cheap version marker for a table, used to build HTTP ETags
+
+        Args:
+            table: Table name (must have an updated_at column)
+
+        Returns:
+            Tuple of (row count, latest updated_at), or (None, None) on error
+        """
         try:
-            # Use count='exact' for efficient counting without fetching data
-            videos_response = self.supabase.table('youtube_videos').select('video_id', count='exact').execute()
-            videos_count = videos_response.count if videos_response.count is not None else 0
+            result = self.supabase.table(table)\
+                .select('updated_at', count='exact')\
+                .order('updated_at', desc=True)\
+                .limit(1)\
+                .execute()
+
+            latest = result.data[0]['updated_at'] if result.data else ''
+            return (result.count or 0, latest)
+
+        except Exception as e:
+            print(f"Error getting version for table {table}: {e}")
+            return (None, None)
 
-            transcripts_response = self.supabase.table('transcripts').select('video_id', count='exact').execute()
-            transcripts_count = transcripts_response.count if transcripts_response.count is not None else 0
+    def get_cache_info(self) -> Dict:
+        """Get database statistics, counting rows at most once a minute"""
+        stats = self._stats_cache.get_or_load('stats', self._count_cache_info)
+        if stats:
+            return stats
+        return {
+            'total_files': 0,
+            'valid_files': 0,
+            'expired_files': 0,
+            'cache_dir': 'Supabase Database (Error)',
+            'ttl_hours': 'Unlimited',
+            'videos_count': 0,
+            'transcripts_count': 0,
+            'summaries_count': 0
+        }
 
-            summaries_response = self.supabase.table('summaries').select('video_id', count='exact').execute()
-            summaries_count = summaries_response.count if summaries_response.count is not None else 0
+    def _count_cache_info(self) -> Optional[Dict]:
+        """Count videos, transcripts and summaries; returns None on error"""
+        try:
+            # HEAD requests return only the Content-Range count; run the three in parallel
+            videos_count, transcripts_count, summaries_count = _db_pool.map(
+                self._count_rows, ['youtube_videos', 'transcripts', 'summaries']
+            )
 
-            print(f"Database stats: {videos_count} videos, {transcripts_count} transcripts, {summaries_count} summaries")
+            logger.debug("Database stats: %d videos, %d transcripts, %d summaries", videos_count, transcripts_count, summaries_count)
 
             return {
                 'total_files': videos_count,
@@ -999,20 +1621,183 @@ class DatabaseStorage:
 
         except Exception as e:
             print(f"Error getting database info: {e}")
+            return None
+
+    def _count_rows(self, table: str) -> int:
+        """Count a table's rows without transferring any of them"""
+        response = self.supabase.table(table).select('*', count='exact', head=True).execute()
+        return response.count if response.count is not None else 0
+
+    def get_all_cached_videos(self, limit: int = 100, before: Optional[str] = None) -> List[Dict]:
+        """
+        Get cached videos newest first, one page at a time
+
+        Uses keyset pagination on created_at (backed by idx_youtube_videos_created_at)
+        so later pages cost the same as the first.
+
+        Args:
+            limit: Maximum number of videos to return
+            before: Only return videos created before this created_at value; pass
+                the last video's 'created_at' to get the next page
+
+        Returns:
+            List of video dicts in the same format as get_cached_videos_paginated
+        """
+        try:
+            def apply(query):
+                query = query.order('created_at', desc=True).limit(limit)
+                return query.lt('created_at', before) if before else query
+
+            videos = self._fetch_video_list(apply)
+            channels_info = self._get_channels_for_videos(videos)
+            now = datetime.now(timezone.utc)
+            return [self._build_video_list_entry(video, channels_info, now) for video in videos]
+
+        except Exception as e:
+            print(f"Error getting cached videos: {e}")
+            return []
+
+    def _fetch_video_list(self, apply) -> List[Dict]:
+        """
+        Fetch video listing rows from the video_list_stats view, or from embedded
+        tables when the view hasn't been created
+
+        Args:
+            apply: Callable adding filters, ordering and limits to a select query
+
+        Returns:
+            Rows accepted by _build_video_list_entry
+        """
+        if self._video_list_view is not False:
+            try:
+                response = apply(self.supabase.table('video_list_stats').select('*')).execute()
+                self._video_list_view = True
+                return response.data or []
+            except Exception as e:
+                # PGRST205 / 42P01: the view has not been created, so stop trying it
+                if isinstance(e, APIError) and e.code in ('PGRST205', '42P01'):
+                    print(f"video_list_stats view unavailable, counting from embedded rows: {e}")
+                    self._video_list_view = False
+                elif self._video_list_view:
+                    raise
+                else:
+                    # Other errors only skip the view for this call
+                    print(f"video_list_stats view query failed, counting from embedded rows: {e}")
+
+        response = apply(self.supabase.table('youtube_videos').select(self.VIDEO_LIST_SELECT)).execute()
+        return response.data or []
+
+    def _get_channels_for_videos(self, videos: List[Dict]) -> Dict[str, Dict]:
+        """Batch fetch channel name and handle for a page of videos, keyed by channel ID"""
+        channel_ids = list(set(video.get('channel_id') for video in videos if video.get('channel_id')))
+
+        channels_info = {}
+        if channel_ids:
+            channels_response = self.supabase.table('youtube_channels')\
+                .select('channel_id, channel_name, handle')\
+                .in_('channel_id', channel_ids)\
+                .execute()
+
+            for channel in channels_response.data:
+                channels_info[channel['channel_id']] = channel
+        return channels_info
+
+    def _build_video_list_entry(self, video: Dict, channels_info: Dict[str, Dict], now: datetime) -> Dict:
+        """
+        Build a video listing entry from a video_list_stats row or a VIDEO_LIST_SELECT row
+
+        Args:
+            video: Listing row
+            channels_info: Channel name and handle keyed by channel ID
+            now: Time the listing was built, shared by every entry's cache age
+        """
+        if 'transcript_entries' in video:
+            # Counts computed by the video_list_stats view
+            transcript_entries = video['transcript_entries'] or 0
+            chapters_count = video['chapters_count'] or 0
+            has_summary = bool(video['has_summary'])
+        else:
+            # Calculate transcript entries count
+            transcript_entries = 0
+            transcripts = _embedded_rows(video.get('transcripts'))
+            if transcripts:
+                transcript_data = transcripts[0].get('transcript_data', [])
+                transcript_entries = len(transcript_data) if transcript_data else 0
+
+            # Calculate chapters count
+            chapters_count = 0
+            video_chapters = _embedded_rows(video.get('video_chapters'))
+            if video_chapters:
+                chapters_data = video_chapters[0].get('chapters_data', [])
+                chapters_count = len(chapters_data) if chapters_data else 0
+
+            # Check if summary exists
+            has_summary = bool(video.get('summaries'))
+
+        # Calculate cache age
+        created_at = self._parse_datetime(video['created_at'])
+        cache_age_hours = (now - created_at).total_seconds() / 3600
+
+        # Get channel information from batched data
+        channel_name = 'Unknown Channel'
+        channel_id = video.get('channel_id')
+        handle = None
+
+        if channel_id and channel_id in channels_info:
+            channel_info = channels_info[channel_id]
+            channel_name = channel_info.get('channel_name', 'Unknown Channel')
+            handle = channel_info.get('handle')
+
+        return {
+            'video_id': video['video_id'],
+            'title': video['title'] or 'Unknown Title',
+            'channel_name': channel_name,
+            'channel_id': channel_id,
+            'handle': handle,
+            'duration': video['duration'],
+            'chapters_count': chapters_count,
+            'transcript_entries': transcript_entries,
+            'cache_age_hours': round(cache_age_hours, 1),
+            'is_valid': True,  # Database entries are always valid
+            'cache_timestamp': created_at.timestamp(),
+            'file_size': 0,  # Not applicable for database
+            'has_summary': has_summary,
+            'created_at': video['created_at'],
+            'published_at': video.get('published_at'),
+            'url_path': video.get('url_path')
+        }
+
+    def get_video_url_info(self, video_id: str) -> Optional[Dict]:
+        """
+        Look up what /watch needs to redirect to a video's SEO-friendly URL
+
+        Args:
+            video_id: YouTube video ID
+
+        Returns:
+            Dict with video_id, url_path and channel handle, or None if the video isn't stored
+        """
+        try:
+            response = self.supabase.table('youtube_videos')\
+                .select('video_id, url_path, channel_id')\
+                .eq('video_id', video_id)\
+                .limit(1)\
+                .execute()
+
+            if not response.data:
+                return None
+
+            video = response.data[0]
+            channel_info = self.get_channel_by_id(video['channel_id']) if video.get('channel_id') else None
             return {
-                'total_files': 0,
-                'valid_files': 0,
-                'expired_files': 0,
-                'cache_dir': 'Supabase Database (Error)',
-                'ttl_hours': 'Unlimited',
-                'videos_count': 0,
-                'transcripts_count': 0,
-                'summaries_count': 0
+                'video_id': video_id,
+                'url_path': video.get('url_path'),
+                'handle': channel_info.get('handle') if channel_info else None
             }
 
-    def get_all_cached_videos(self) -> List[Dict]:
-        """Get list of all cached videos with metadata from database"""
-        return self.get_cached_videos_paginated()['videos']
+        except Exception as e:
+            print(f"Error getting URL info for {video_id}: {e}")
+            return None
 
     def get_cached_videos_paginated(self, page: int = 1, per_page: int = 20, group_by_channel: bool = False) -> Dict:
         """Get paginated list of cached videos with metadata from database"""
@@ -1025,81 +1810,18 @@ class DatabaseStorage:
             
             # Get total count for pagination
             count_response = self.supabase.table('youtube_videos')\
-                .select('video_id', count='exact')\
+                .select('video_id', count='exact', head=True)\
                 .execute()
             total_videos = count_response.count if count_response.count is not None else 0
             
-            # Get paginated videos with their transcripts, summaries, and channel information
-            response = self.supabase.table('youtube_videos')\
-                .select('*, transcripts(transcript_data), summaries(summary_text), video_chapters(chapters_data)')\
-                .order('created_at', desc=True)\
-                .range(offset, offset + per_page - 1)\
-                .execute()
-            
-            # Get all unique channel IDs from the videos
-            channel_ids = list(set(video.get('channel_id') for video in response.data if video.get('channel_id')))
+            # Get paginated videos with their counts and channel information
+            videos = self._fetch_video_list(
+                lambda query: query.order('created_at', desc=True).range(offset, offset + per_page - 1)
+            )
             
-            # Batch fetch all channel information in one query
-            channels_info = {}
-            if channel_ids:
-                channels_response = self.supabase.table('youtube_channels')\
-                    .select('channel_id, channel_name, handle')\
-                    .in_('channel_id', channel_ids)\
-                    .execute()
-                
-                for channel in channels_response.data:
-                    channels_info[channel['channel_id']] = channel
-
-            cached_videos = []
-
-            for video in response.data:
-                # Calculate transcript entries count
-                transcript_entries = 0
-                if video.get('transcripts') and len(video['transcripts']) > 0:
-                    transcript_data = video['transcripts'][0].get('transcript_data', [])
-                    transcript_entries = len(transcript_data) if transcript_data else 0
-
-                # Calculate chapters count
-                chapters_count = 0
-                if video.get('video_chapters') and len(video['video_chapters']) > 0:
-                    chapters_data = video['video_chapters'][0].get('chapters_data', [])
-                    chapters_count = len(chapters_data) if chapters_data else 0
-
-                # Calculate cache age
-                created_at = self._parse_datetime(video['created_at'])
-                cache_age_hours = (datetime.now(timezone.utc) - created_at).total_seconds() / 3600
-
-                # Check if summary exists
-                has_summary = video.get('summaries') and len(video['summaries']) > 0
-
-                # Get channel information from batched data
-                channel_name = 'Unknown Channel'
-                channel_id = video.get('channel_id')
-                handle = None
-                
-                if channel_id and channel_id in channels_info:
-                    channel_info = channels_info[channel_id]
-                    channel_name = channel_info.get('channel_name', 'Unknown Channel')
-                    handle = channel_info.get('handle')
-
-                cached_videos.append({
-                    'video_id': video['video_id'],
-                    'title': video['title'] or 'Unknown Title',
-                    'channel_name': channel_name,
-                    'channel_id': channel_id,
-                    'handle': handle,
-                    'duration': video['duration'],
-                    'chapters_count': chapters_count,
-                    'transcript_entries': transcript_entries,
-                    'cache_age_hours': round(cache_age_hours, 1),
-                    'is_valid': True,  # Database entries are always valid
-                    'cache_timestamp': time.mktime(created_at.timetuple()),
-                    'file_size': 0,  # Not applicable for database
-                    'has_summary': has_summary,
-                    'created_at': video['created_at'],
-                    'published_at': video.get('published_at'),
-                    'url_path': video.get('url_path')
-                })
+            channels_info = self._get_channels_for_videos(videos)
+            now = datetime.now(timezone.utc)
+            cached_videos = [self._build_video_list_entry(video, channels_info, now) for video in videos]
 
             # Calculate pagination metadata
             total_pages = (total_videos + per_page - 1) // per_page
@@ -1136,104 +1858,98 @@ class DatabaseStorage:
                 }
             }
 
+    def _get_channel_video_counts_page(self, offset: int, per_page: int):
+        """
+        Get one page of channels with their video counts from the channel_video_counts view
+
+        Args:
+            offset: Number of channels to skip (ordered by channel name)
+            per_page: Number of channels to return
+
+        Returns:
+            Tuple of (channels, total channel count), or None if the view has not
+            been created yet
+        """
+        try:
+            response = self.supabase.table('channel_video_counts')\
+                .select('channel_id, channel_name, handle, video_count', count='exact')\
+                .order('channel_name')\
+                .range(offset, offset + per_page - 1)\
+                .execute()
+        except Exception as e:
+            print(f"Channel video counts view unavailable, counting videos in Python: {e}")
+            return None
+        return response.data or [], response.count or 0
+
     def _get_videos_grouped_by_channel_paginated(self, page: int = 1, per_page: int = 5) -> Dict:
         """Get videos grouped by channel with pagination at the channel level"""
         try:
             # Calculate offset for channels
             offset = (page - 1) * per_page
             
-            # Get channels that have videos with their video counts efficiently
-            # First get all videos to count by channel
-            videos_response = self.supabase.table('youtube_videos')\
-                .select('channel_id')\
-                .execute()
-            
-            # Count videos by channel
-            channel_video_counts = {}
-            for video in videos_response.data:
-                channel_id = video.get('channel_id')
-                if channel_id:
-                    channel_video_counts[channel_id] = channel_video_counts.get(channel_id, 0) + 1
-            
-            # Get channel info for channels that have videos
-            channel_ids_with_videos = list(channel_video_counts.keys())
-            all_channels_with_counts = []
-            
-            if channel_ids_with_videos:
-                channels_response = self.supabase.table('youtube_channels')\
-                    .select('channel_id, channel_name, handle')\
-                    .in_('channel_id', channel_ids_with_videos)\
-                    .order('channel_name')\
+            # Channels with their video counts, counted in the database when possible
+            channel_page = self._get_channel_video_counts_page(offset, per_page)
+            if channel_page is not None:
+                paginated_channels, total_channels = channel_page
+            else:
+                # Get channels that have videos with their video counts efficiently
+                # First get all videos to count by channel
+                videos_response = self.supabase.table('youtube_videos')\
+                    .select('channel_id')\
                     .execute()
+            
+                # Count videos by channel
+                channel_video_counts = {}
+                for video in videos_response.data:
+                    channel_id = video.get('channel_id')
+                    if channel_id:
+                        channel_video_counts[channel_id] = channel_video_counts.get(channel_id, 0) + 1
+            
+                # Get channel info for channels that have videos
+                channel_ids_with_videos = list(channel_video_counts.keys())
+                all_channels_with_counts = []
+            
+                if channel_ids_with_videos:
+                    channels_response = self.supabase.table('youtube_channels')\
+                        .select('channel_id, channel_name, handle')\
+                        .in_('channel_id', channel_ids_with_videos)\
+                        .order('channel_name')\
+                        .execute()
                 
-                for channel in channels_response.data:
-                    channel_id = channel['channel_id']
-                    all_channels_with_counts.append({
-                        'channel_id': channel_id,
-                        'channel_name': channel['channel_name'],
-                        'handle': channel['handle'],
-                        'video_count': channel_video_counts[channel_id]
-                    })
+                    for channel in channels_response.data:
+                        channel_id = channel['channel_id']
+                        all_channels_with_counts.append({
+                            'channel_id': channel_id,
+                            'channel_name': channel['channel_name'],
+                            'handle': channel['handle'],
+                            'video_count': channel_video_counts[channel_id]
+                        })
             
-            total_channels = len(all_channels_with_counts)
+                total_channels = len(all_channels_with_counts)
             
-            # Get paginated channels
-            paginated_channels = all_channels_with_counts[offset:offset + per_page]
+                # Get paginated channels
+                paginated_channels = all_channels_with_counts[offset:offset + per_page]
             
             # For each channel, get some videos (limit to keep performance good)
             grouped_data = []
             videos_per_channel = 12  # Show up to 12 videos per channel
+            now = datetime.now(timezone.utc)
             
-            for channel in paginated_channels:
+            def load_channel_videos(channel):
+                channel_id = channel['channel_id']
+                videos = self._fetch_video_list(
+                    lambda query: query.eq('channel_id', channel_id).order('created_at', desc=True).limit(videos_per_channel)
+                )
+                channels_info = {channel_id: {'channel_name': channel['channel_name'], 'handle': channel['handle']}}
+                return [self._build_video_list_entry(video, channels_info, now) for video in videos]
+
+            # Each channel's videos are an independent query, so fetch them in parallel
+            for channel, channel_videos in zip(paginated_channels, _db_pool.map(load_channel_videos, paginated_channels)):
                 channel_id = channel['channel_id']
                 channel_name = channel['channel_name']
                 handle = channel['handle']
                 total_videos_in_channel = channel['video_count']
-                
-                # Get videos for this channel
-                videos_response = self.supabase.table('youtube_videos')\
-                    .select('*, transcripts(transcript_data), summaries(summary_text), video_chapters(chapters_data)')\
-                    .eq('channel_id', channel_id)\
-                    .order('created_at', desc=True)\
-                    .limit(videos_per_channel)\
-                    .execute()
-                
-                channel_videos = []
-                for video in videos_response.data:
-                    # Process video data (same as regular pagination)
-                    transcript_entries = 0
-                    if video.get('transcripts') and len(video['transcripts']) > 0:
-                        transcript_data = video['transcripts'][0].get('transcript_data', [])
-                        transcript_entries = len(transcript_data) if transcript_data else 0
-
-                    chapters_count = 0
-                    if video.get('video_chapters') and len(video['video_chapters']) > 0:
-                        chapters_data = video['video_chapters'][0].get('chapters_data', [])
-                        chapters_count = len(chapters_data) if chapters_data else 0
-
-                    created_at = self._parse_datetime(video['created_at'])
-                    cache_age_hours = (datetime.now(timezone.utc) - created_at).total_seconds() / 3600
-                    has_summary = video.get('summaries') and len(video['summaries']) > 0
-
-                    channel_videos.append({
-                        'video_id': video['video_id'],
-                        'title': video['title'] or 'Unknown Title',
-                        'channel_name': channel_name,
-                        'channel_id': channel_id,
-                        'handle': handle,
-                        'duration': video['duration'],
-                        'chapters_count': chapters_count,
-                        'transcript_entries': transcript_entries,
-                        'cache_age_hours': round(cache_age_hours, 1),
-                        'is_valid': True,
-                        'cache_timestamp': time.mktime(created_at.timetuple()),
-                        'file_size': 0,
-                        'has_summary': has_summary,
-                        'created_at': video['created_at'],
-                        'published_at': video.get('published_at'),
-                        'url_path': video.get('url_path')
-                    })
-                
+
                 # Check if any videos in this channel have summaries for the summary link
                 has_summaries = any(video['has_summary'] for video in channel_videos)
                 
@@ -1292,6 +2008,7 @@ class DatabaseStorage:
             response = self.supabase.table('youtube_videos')\
                 .select('*')\
                 .eq('url_path', url_path)\
+                .limit(1)\
                 .execute()
             
             if response.data and len(response.data) > 0:
@@ -1323,7 +2040,7 @@ class DatabaseStorage:
                     'channel_id': channel_id,
                     'handle': handle,
                     'duration': video['duration'],
-                    'thumbnail_url': video.get('thumbnail_url'),
+                    'thumbnail_url': youtube_thumbnail_url(video['video_id']),
                     'published_at': video.get('published_at'),
                     'created_at': video['created_at'],
                     'url_path': video.get('url_path')
@@ -1345,6 +2062,11 @@ class DatabaseStorage:
         """
         try:
             if channel_id:
+                cache_key = f"ch:{channel_id}:{sort_by}"
+                cached = redis_cache.get_json(cache_key)
+                if cached is not None:
+                    return cached
+
                 # Determine sort field and order
                 if sort_by == 'added':
                     sort_field = 'created_at'
@@ -1353,7 +2075,7 @@ class DatabaseStorage:
                 
                 # Use channel_id directly - no JOIN to avoid foreign key issues
                 query = self.supabase.table('youtube_videos')\
-                    .select('*')\
+                    .select(self.CHANNEL_VIDEO_SELECT)\
                     .eq('channel_id', channel_id)\
                     .order(sort_field, desc=True)
                 
@@ -1377,13 +2099,14 @@ class DatabaseStorage:
                     except Exception as e:
                         print(f"Warning: Could not fetch channel info for {channel_id}: {e}")
                 
+                redis_cache.set_json(cache_key, videos)
                 return videos
             
             elif channel_name:
                 # Try to find channel by name first, then get videos by channel_id
                 channel_info = self.get_channel_by_name(channel_name)
                 if channel_info:
-                    return self.get_videos_by_channel(channel_id=channel_info['channel_id'])
+                    return self.get_videos_by_channel(channel_id=channel_info['channel_id'], sort_by=sort_by)
                 else:
                     # No channel found
                     return []
@@ -1402,7 +2125,7 @@ class DatabaseStorage:
             # WHERE t.transcript_data = '[]' AND v.channel_id = channel_id
             
             response = self.supabase.table('transcripts')\
-                .select('video_id, youtube_videos(video_id, title, channel_id, created_at, published_at, duration, thumbnail_url, url_path)')\
+                .select('video_id, youtube_videos(video_id, title, channel_id, created_at, published_at, duration, url_path)')\
                 .eq('transcript_data', [])\
                 .eq('youtube_videos.channel_id', channel_id)\
                 .execute()
@@ -1416,6 +2139,7 @@ class DatabaseStorage:
             for item in response.data:
                 if item.get('youtube_videos'):
                     video = item['youtube_videos'].copy()
+                    video['thumbnail_url'] = youtube_thumbnail_url(video['video_id'])
                     videos.append(video)
             
             # Get channel info separately (batch query)
@@ -1449,22 +2173,24 @@ class DatabaseStorage:
         try:
             print(f"Deleting video {video_id} and all associated data...")
 
-            # Delete summaries first (foreign key dependency)
-            summaries_response = self.supabase.table('summaries').delete().eq('video_id', video_id).execute()
-            print(f"Deleted summaries: {len(summaries_response.data) if summaries_response.data else 0}")
-
-            # Delete chapters
-            chapters_response = self.supabase.table('video_chapters').delete().eq('video_id', video_id).execute()
-            print(f"Deleted chapters: {len(chapters_response.data) if chapters_response.data else 0}")
-
-            # Delete transcripts
-            transcripts_response = self.supabase.table('transcripts').delete().eq('video_id', video_id).execute()
-            print(f"Deleted transcripts: {len(transcripts_response.data) if transcripts_response.data else 0}")
-
-            # Delete the main video record
-            video_response = self.supabase.table('youtube_videos').delete().eq('video_id', video_id).execute()
+            # Transcripts, chapters and summaries are removed by ON DELETE CASCADE
+            try:
+                video_response = self._delete_video_row(video_id)
+            except Exception as e:
+                if 'foreign key' not in str(e).lower() and '23503' not in str(e):
+                    raise
+                # Foreign keys created without ON DELETE CASCADE (see sql/add_video_delete_cascade.sql)
+                print(f"Cascade delete unavailable, deleting dependent rows first: {e}")
+                list(_db_pool.map(
+                    lambda table: self.supabase.table(table).delete(returning=ReturnMethod.minimal).eq('video_id', video_id).execute(),
+                    ['summaries', 'video_chapters', 'transcripts']
+                ))
+                video_response = self._delete_video_row(video_id)
             print(f"Deleted video: {len(video_response.data) if video_response.data else 0}")
 
+            channel_ids = {row.get('channel_id') for row in video_response.data or []}
+            self._invalidate_video_cache(video_id, *channel_ids)
+
             return True
 
         except Exception as e:
@@ -1473,6 +2199,12 @@ class DatabaseStorage:
 
     
 
+    def _delete_video_row(self, video_id: str):
+        """Delete a youtube_videos row, returning only its channel_id for cache invalidation"""
+        query = self.supabase.table('youtube_videos').delete().eq('video_id', video_id)
+        query.params = query.params.add('select', 'channel_id')
+        return query.execute()
+
     def get_all_channels(self, page: int = 1, per_page: int = 20):
         """Get all channels with video counts and summary counts - OPTIMIZED VERSION with pagination"""
         try:
@@ -1497,15 +2229,85 @@ class DatabaseStorage:
                 }
             }
 
+    def _get_channel_overview_page(self, offset: int, per_page: int):
+        """
+        Get one page of channels from the channel_overview_stats view
+
+        Args:
+            offset: Number of channels to skip (newest video first)
+            per_page: Number of channels to return
+
+        Returns:
+            Tuple of (channels in the get_all_channels format, total channel count),
+            or None if the view has not been created yet
+        """
+        try:
+            response = self.supabase.table('channel_overview_stats')\
+                .select('*', count='exact')\
+                .order('latest_video_date', desc=True)\
+                .order('video_count', desc=True)\
+                .range(offset, offset + per_page - 1)\
+                .execute()
+        except Exception as e:
+            print(f"Channel overview view unavailable, aggregating channels in Python: {e}")
+            return None
+
+        channels = []
+        for row in response.data or []:
+            recent_videos = {}
+            for video in row.get('recent_videos') or []:
+                recent_videos[video['video_id']] = {
+                    'video_info': {
+                        'title': video.get('title'),
+                        'duration': video.get('duration'),
+                        'channel_name': row['channel_name']
+                    },
+                    'video_id': video['video_id'],
+                    'url_path': video.get('url_path'),
+                    'has_summary': video.get('has_summary', False)
+                }
+            channels.append({
+                'channel_id': row['channel_id'],
+                'name': row['channel_name'],
+                'handle': row['handle'],
+                'video_count': row['video_count'],
+                'summary_count': row['summary_count'],
+                'thumbnail_url': row.get('thumbnail_url'),
+                'recent_videos': recent_videos,
+                'latest_video_date': row.get('latest_video_date')
+            })
+        return channels, response.count or 0
+
     def _get_all_channels_optimized(self, page: int = 1, per_page: int = 20):
         """Optimized implementation using minimal database calls with pagination"""
         try:
             # Calculate offset
             offset = (page - 1) * per_page
             
+            # Counts and recent videos aggregated in the database when the view exists
+            channel_page = self._get_channel_overview_page(offset, per_page)
+            if channel_page is not None:
+                paginated_channels, total_channels_with_videos = channel_page
+                total_pages = (total_channels_with_videos + per_page - 1) // per_page
+                has_prev = page > 1
+                has_next = page < total_pages
+                return {
+                    'channels': paginated_channels,
+                    'pagination': {
+                        'page': page,
+                        'per_page': per_page,
+                        'total': total_channels_with_videos,
+                        'total_pages': total_pages,
+                        'has_prev': has_prev,
+                        'has_next': has_next,
+                        'prev_page': page - 1 if has_prev else None,
+                        'next_page': page + 1 if has_next else None
+                    }
+                }
+            
             # Get total count first for pagination
             total_channels_result = self.supabase.table('youtube_channels')\
-                .select('channel_id', count='exact')\
+                .select('channel_id', count='exact', head=True)\
                 .not_.is_('handle', 'null')\
                 .execute()
             
@@ -1601,7 +2403,6 @@ class DatabaseStorage:
                     recent_videos[video_id] = {
                         'video_info': {
                             'title': video.get('title'),
-                            'thumbnail_url': f"https://img.youtube.com/vi/{video_id}/maxresdefault.jpg",
                             'duration': video.get('duration'),
                             'channel_name': data['info']['channel_name']
                         },
@@ -1715,6 +2516,8 @@ class DatabaseStorage:
                 'tags': tags
             }).execute()
 
+            redis_cache.delete_pattern("snips:*")
+
             if result.data:
                 print(f"Memory snippet saved successfully for video {video_id}")
                 return True
@@ -1726,72 +2529,56 @@ class DatabaseStorage:
             print(f"Error saving memory snippet: {e}")
             return False
 
-    def get_memory_snippets(self, video_id: str = None, limit: int = 100) -> list:
-        """Get memory snippets, optionally filtered by video_id"""
+    def get_memory_snippets(self, video_id: str = None, limit: int = 100, channel_id: str = None) -> list:
+        """Get memory snippets newest first, optionally filtered by video_id or channel_id"""
         if not self.supabase:
             print("Database not initialized")
             return []
 
-        try:
-            print(f"get_memory_snippets called with video_id={video_id}, limit={limit}")
-            # Get memory snippets without JOINs to avoid foreign key issues
-            query = self.supabase.table('memory_snippets').select(
-                'id, video_id, snippet_text, context_before, context_after, tags, created_at'
-            ).order('created_at', desc=True).limit(limit)
+        cache_key = f"snips:{video_id or 'all'}:{channel_id or 'all'}:{limit}"
+        cached = redis_cache.get_json(cache_key)
+        if cached is not None:
+            return cached
 
-            if video_id:
-                query = query.eq('video_id', video_id)
+        try:
+            # Load snippets together with their video and channel rows in a single
+            # embedded query instead of two lookups per snippet
+            # (an inner join when filtering by channel, so the filter runs in the database)
+            try:
+                snippets = self._query_memory_snippets(
+                    f"youtube_videos{'!inner' if channel_id else ''}(title, channel_id, url_path, duration, "
+                    'youtube_channels(channel_name, channel_id, thumbnail_url, handle))',
+                    video_id, limit, channel_id
+                )
+            except Exception as embed_error:
+                # Databases without the snippet -> video relationship (sql/add_memory_snippets_indexes.sql) cannot embed
+                print(f"Snippet embed unavailable, using batched lookups: {embed_error}")
+                video_ids = None
+                if channel_id:
+                    videos_result = self.supabase.table('youtube_videos')\
+                        .select('video_id')\
+                        .eq('channel_id', channel_id)\
+                        .execute()
+                    video_ids = [video['video_id'] for video in videos_result.data or []]
+                snippets = self._query_memory_snippets(None, video_id, limit, video_ids=video_ids)
+                self._attach_snippet_videos(snippets)
 
-            result = query.execute()
-            snippets = result.data if result.data else []
-            
-            # Get video information for each snippet separately
             for snippet in snippets:
-                try:
-                    video_result = self.supabase.table('youtube_videos').select(
-                        'title, thumbnail_url, channel_id'
-                    ).eq('video_id', snippet['video_id']).execute()
-                    
-                    if video_result.data:
-                        video_data = video_result.data[0]
-                        snippet['youtube_videos'] = video_data  # Store as object, not array
-                        
-                        # Get channel information if channel_id exists
-                        channel_id = video_data.get('channel_id')
-                        if channel_id:
-                            try:
-                                channel_result = self.supabase.table('youtube_channels').select(
-                                    'channel_name, channel_id, thumbnail_url, handle'
-                                ).eq('channel_id', channel_id).execute()
-                                
-                                if channel_result.data:
-                                    channel_data = channel_result.data[0]
-                                    snippet['channel_name'] = channel_data['channel_name']
-                                    snippet['channel_id'] = channel_data['channel_id']
-                                    snippet['channel_thumbnail_url'] = channel_data.get('thumbnail_url')
-                                    snippet['handle'] = channel_data.get('handle')
-                                else:
-                                    snippet['channel_name'] = 'Unknown Channel'
-                                    snippet['channel_id'] = channel_id
-                            except Exception as channel_error:
-                                print(f"Warning: Could not fetch channel info for {channel_id}: {channel_error}")
-                                snippet['channel_name'] = 'Unknown Channel'
-                                snippet['channel_id'] = channel_id
-                        else:
-                            snippet['channel_name'] = 'Unknown Channel'
-                            snippet['channel_id'] = None
-                    else:
-                        snippet['youtube_videos'] = {}
-                        snippet['channel_name'] = 'Unknown Channel'
-                        snippet['channel_id'] = None
-                        
-                except Exception as video_error:
-                    print(f"Error getting video info for {snippet['video_id']}: {video_error}")
-                    snippet['youtube_videos'] = {}
-                    snippet['channel_name'] = 'Unknown Channel'
-                    snippet['channel_id'] = None
-            
-            print(f"get_memory_snippets returning {len(snippets)} snippets")
+                video_data = snippet.get('youtube_videos') or {}
+                if isinstance(video_data, list):
+                    video_data = video_data[0] if video_data else {}
+                channel_data = video_data.pop('youtube_channels', None) or {}
+                if video_data:
+                    video_data['thumbnail_url'] = youtube_thumbnail_url(snippet['video_id'])
+
+                snippet['youtube_videos'] = video_data  # Store as object, not array
+                snippet['channel_name'] = channel_data.get('channel_name') or 'Unknown Channel'
+                snippet['channel_id'] = channel_data.get('channel_id') or video_data.get('channel_id')
+                if channel_data:
+                    snippet['channel_thumbnail_url'] = channel_data.get('thumbnail_url')
+                    snippet['handle'] = channel_data.get('handle')
+
+            redis_cache.set_json(cache_key, snippets)
             return snippets
                 
         except Exception as e:
@@ -1800,6 +2587,61 @@ class DatabaseStorage:
             traceback.print_exc()
             return []
 
+    def _query_memory_snippets(self, embed: Optional[str], video_id: str = None, limit: int = 100,
+                               channel_id: str = None, video_ids: List[str] = None) -> list:
+        """Select memory snippets newest first, optionally with an embedded resource
+
+        channel_id filters on the embedded youtube_videos row; video_ids restricts
+        the snippets to a known set of videos when there is no embed.
+        """
+        if video_ids is not None and not video_ids:
+            return []
+
+        columns = 'id, video_id, snippet_text, context_before, context_after, tags, created_at'
+        if embed:
+            columns = f"{columns}, {embed}"
+
+        query = self.supabase.table('memory_snippets').select(columns)\
+            .order('created_at', desc=True)\
+            .limit(limit)
+
+        if video_id:
+            query = query.eq('video_id', video_id)
+        if channel_id:
+            query = query.eq('youtube_videos.channel_id', channel_id)
+        if video_ids is not None:
+            query = query.in_('video_id', video_ids)
+
+        result = query.execute()
+        return result.data if result.data else []
+
+    def _attach_snippet_videos(self, snippets: list):
+        """Attach video and channel rows to snippets with one batched query per table"""
+        video_ids = list({snippet['video_id'] for snippet in snippets})
+        if not video_ids:
+            return
+
+        videos_result = self.supabase.table('youtube_videos')\
+            .select('video_id, title, channel_id, url_path, duration')\
+            .in_('video_id', video_ids)\
+            .execute()
+        videos = {video.pop('video_id'): video for video in (videos_result.data or [])}
+
+        channel_ids = list({video['channel_id'] for video in videos.values() if video.get('channel_id')})
+        channels = {}
+        if channel_ids:
+            channels_result = self.supabase.table('youtube_channels')\
+                .select('channel_name, channel_id, thumbnail_url, handle')\
+                .in_('channel_id', channel_ids)\
+                .execute()
+            channels = {channel['channel_id']: channel for channel in (channels_result.data or [])}
+
+        for snippet in snippets:
+            video_data = dict(videos.get(snippet['video_id'], {}))
+            if video_data.get('channel_id') in channels:
+                video_data['youtube_channels'] = channels[video_data['channel_id']]
+            snippet['youtube_videos'] = video_data
+
     def delete_memory_snippet(self, snippet_id: str) -> bool:
         """Delete a memory snippet by ID"""
         if not self.supabase:
@@ -1808,6 +2650,7 @@ class DatabaseStorage:
 
         try:
             result = self.supabase.table('memory_snippets').delete().eq('id', snippet_id).execute()
+            redis_cache.delete_pattern("snips:*")
             
             if result.data:
                 print(f"Memory snippet {snippet_id} deleted successfully")
@@ -1831,6 +2674,7 @@ class DatabaseStorage:
                 'tags': tags,
                 'updated_at': 'NOW()'
             }).eq('id', snippet_id).execute()
+            redis_cache.delete_pattern("snips:*")
             
             if result.data:
                 print(f"Memory snippet {snippet_id} tags updated successfully")
@@ -1851,7 +2695,7 @@ class DatabaseStorage:
 
         try:
             # Get total count
-            count_result = self.supabase.table('memory_snippets').select('id', count='exact').execute()
+            count_result = self.supabase.table('memory_snippets').select('id', count='exact', head=True).execute()
             total_snippets = count_result.count if count_result.count is not None else 0
 
             # Get snippets by video count
@@ -1867,7 +2711,24 @@ class DatabaseStorage:
             print(f"Error getting memory snippets stats: {e}")
             return {'total_snippets': 0, 'videos_with_snippets': 0}
 
+    def get_memory_snippet_video_stats(self) -> Optional[List[Dict]]:
+        """
+        Get per-video snippet counts from the memory_snippet_video_stats view
 
+        Returns:
+            Rows with video, channel, snippet_count and latest_date, newest first,
+            or None if the view has not been created yet
+        """
+        try:
+            response = self.supabase.table('memory_snippet_video_stats')\
+                .select('*')\
+                .order('latest_date', desc=True)\
+                .execute()
+            return response.data or []
+
+        except Exception as e:
+            print(f"Snippet stats view unavailable, grouping snippets in Python: {e}")
+            return None
 
     def get_channel_by_name(self, channel_name: str) -> Optional[Dict]:
         """Get channel by name"""
@@ -1875,6 +2736,7 @@ class DatabaseStorage:
             result = self.supabase.table('youtube_channels')\
                 .select('*')\
                 .eq('channel_name', channel_name)\
+                .limit(1)\
                 .execute()
             
             return result.data[0] if result.data else None
@@ -1903,18 +2765,98 @@ class DatabaseStorage:
             # Ensure handle starts with @
             if not handle.startswith('@'):
                 handle = f"@{handle}"
+
+            cached = self._channel_handle_cache.get(handle)
+            if cached is not None:
+                return cached
             
             result = self.supabase.table('youtube_channels')\
                 .select('*')\
                 .eq('handle', handle)\
+                .limit(1)\
                 .execute()
             
-            return result.data[0] if result.data else None
+            if not result.data:
+                return None
+
+            self._channel_handle_cache.set(handle, result.data[0])
+            return dict(result.data[0])
             
         except Exception as e:
             print(f"Error getting channel by handle {handle}: {e}")
             return None
 
+    def _evict(self, video_id: str, video: bool = True):
+        """
+        Drop a video's in-process cache entries here and in every other worker
+
+        Args:
+            video_id: YouTube video ID
+            video: False when only the summary changed (keeps the cached video data)
+        """
+        self._publish_eviction(f"{'v' if video else 's'}:{video_id}")
+
+    def _publish_eviction(self, message: str):
+        """Apply an eviction message here and send it to every other worker"""
+        self._evict_local(message)
+        redis_cache.publish(self.CACHE_INVALIDATION_CHANNEL, message)
+
+    def _evict_local(self, message: str):
+        """
+        Apply an eviction message to this process's caches
+
+        "v:<video_id>" and "s:<video_id>" drop a video's data or summary; "c:"
+        only drops the channel lookups and stats, which every message clears.
+        """
+        kind, _, video_id = message.partition(':')
+        self._channel_handle_cache.clear()
+        self._stats_cache.clear()
+        if kind == 'c':
+            return
+        self._summary_cache.pop(video_id)
+        if kind == 'v':
+            self._video_cache.pop(video_id)
+
+    def listen_for_evictions(self) -> bool:
+        """
+        Apply evictions published by other workers to this process's caches
+
+        With Redis configured, writes in any worker then clear these caches in every
+        worker. Called once for the shared instance by get_storage().
+
+        Returns:
+            Whether a listener is running (False without Redis)
+        """
+        if self._eviction_listener is None:
+            self._eviction_listener = redis_cache.subscribe(self.CACHE_INVALIDATION_CHANNEL, self._evict_local)
+            if self._eviction_listener is not None:
+                # Evictions now reach every worker; transcripts rarely change
+                self._video_cache.ttl = 3600
+                self._summary_cache.ttl = 300
+        return self._eviction_listener is not None
+
+    def close(self):
+        """Stop the eviction listener and close the database connection pool"""
+        if self._eviction_listener is not None:
+            self._eviction_listener.set()
+            self._eviction_listener = None
+        self.supabase.postgrest.session.close()
+
+    def _invalidate_video_cache(self, video_id: str, *channel_ids: str):
+        """Drop cached reads that include a video after it is written or deleted"""
+        self._evict(video_id)
+        redis_cache.delete(f"v:{video_id}", f"sum:{video_id}")
+        for channel_id in channel_ids:
+            if channel_id:
+                redis_cache.delete_pattern(f"ch:{channel_id}:*")
+        redis_cache.delete_pattern("snips:*")
+
+    def clear_channel_cache(self):
+        """Drop cached channel lookups after channel rows change, here and in every other worker"""
+        self._publish_eviction('c:')
+        redis_cache.delete_pattern("ch:*")
+        redis_cache.delete_pattern("snips:*")
+
     def update_channel_info(self, channel_id: str, **kwargs):
         """Update channel information"""
         try:
@@ -1927,6 +2869,7 @@ class DatabaseStorage:
                 .update(update_data)\
                 .eq('channel_id', channel_id)\
                 .execute()
+            self.clear_channel_cache()
             
             return bool(result.data)
             
@@ -1956,7 +2899,7 @@ class DatabaseStorage:
                 # Delete all chat messages for these conversations
                 for conv_id in conversation_ids:
                     self.supabase.table('chat_messages')\
-                        .delete()\
+                        .delete(returning=ReturnMethod.minimal)\
                         .eq('conversation_id', conv_id)\
                         .execute()
                     print(f"Deleted messages for conversation {conv_id}")
@@ -1964,7 +2907,7 @@ class DatabaseStorage:
                 # Delete the conversations themselves
                 for conv_id in conversation_ids:
                     self.supabase.table('chat_conversations')\
-                        .delete()\
+                        .delete(returning=ReturnMethod.minimal)\
                         .eq('id', conv_id)\
                         .execute()
                     print(f"Deleted conversation {conv_id}")
@@ -1972,7 +2915,7 @@ class DatabaseStorage:
             # Step 2: Delete channel_chat entries
             print(f"Deleting channel chat entries for channel {channel_id}...")
             self.supabase.table('channel_chat')\
-                .delete()\
+                .delete(returning=ReturnMethod.minimal)\
                 .eq('channel_id', channel_id)\
                 .execute()
             print(f"Deleted channel chat entries for channel {channel_id}")
@@ -2002,6 +2945,7 @@ class DatabaseStorage:
                 .delete()\
                 .eq('channel_id', channel_id)\
                 .execute()
+            self.clear_channel_cache()
             
             if channel_response.data:
                 print(f"Successfully deleted channel {channel_id} and all associated data")
@@ -2219,12 +3163,13 @@ class DatabaseStorage:
             
             # If no rows were updated, try to insert
             if len(response.data) == 0:
+                now = datetime.now(timezone.utc).isoformat()
                 setting_data = {
                     'setting_key': key,
                     'setting_value': value_str,
                     'setting_type': setting_type,
-                    'created_at': datetime.now(timezone.utc).isoformat(),
-                    'updated_at': datetime.now(timezone.utc).isoformat()
+                    'created_at': now,
+                    'updated_at': now
                 }
                 
                 response = self.supabase.table('import_settings').insert(setting_data).execute()
@@ -2324,12 +3269,13 @@ class DatabaseStorage:
             
             # If no rows were updated, try to insert
             if len(response.data) == 0:
+                now = datetime.now(timezone.utc).isoformat()
                 setting_data = {
                     'setting_key': key,
                     'setting_value': value_str,
                     'setting_type': setting_type,
-                    'created_at': datetime.now(timezone.utc).isoformat(),
-                    'updated_at': datetime.now(timezone.utc).isoformat()
+                    'created_at': now,
+                    'updated_at': now
                 }
                 
                 response = self.supabase.table('summarizer_settings').insert(setting_data).execute()
@@ -2417,7 +3363,7 @@ class DatabaseStorage:
         """Delete a chat conversation and all its messages"""
         try:
             # Delete messages first (cascade should handle this, but being explicit)
-            self.supabase.table('chat_messages').delete().eq('conversation_id', conversation_id).execute()
+            self.supabase.table('chat_messages').delete(returning=ReturnMethod.minimal).eq('conversation_id', conversation_id).execute()
             
             # Delete conversation
             response = self.supabase.table('chat_conversations').delete().eq('id', conversation_id).eq('channel_id', channel_id).execute()
@@ -2457,11 +3403,11 @@ class DatabaseStorage:
         """Get chat statistics"""
         try:
             # Get total conversations
-            conv_response = self.supabase.table('chat_conversations').select('id', count='exact').execute()
+            conv_response = self.supabase.table('chat_conversations').select('id', count='exact', head=True).execute()
             total_conversations = conv_response.count if conv_response.count else 0
             
             # Get total messages
-            msg_response = self.supabase.table('chat_messages').select('id', count='exact').execute()
+            msg_response = self.supabase.table('chat_messages').select('id', count='exact', head=True).execute()
             total_messages = msg_response.count if msg_response.count else 0
             
             return {
@@ -2571,7 +3517,7 @@ class DatabaseStorage:
         """Delete a global chat conversation and all its messages"""
         try:
             # Delete messages first (cascade should handle this, but being explicit)
-            self.supabase.table('chat_messages').delete().eq('conversation_id', conversation_id).execute()
+            self.supabase.table('chat_messages').delete(returning=ReturnMethod.minimal).eq('conversation_id', conversation_id).execute()
             
             # Delete conversation
             response = self.supabase.table('chat_conversations').delete().eq('id', conversation_id).execute()
@@ -2611,7 +3557,7 @@ class DatabaseStorage:
     def get_summaries_count(self) -> int:
         """Get total count of all summaries across all channels"""
         try:
-            response = self.supabase.table('summaries').select('video_id', count='exact').execute()
+            response = self.supabase.table('summaries').select('video_id', count='exact', head=True).execute()
             return response.count if response.count else 0
         except Exception as e:
             print(f"Error getting summaries count: {e}")
@@ -2660,5 +3606,37 @@ class DatabaseStorage:
             prompt_name=prompt_name
         )
 
-# Global database storage instance
-database_storage = DatabaseStorage()
\ No newline at end of file
+_instance = None
+_instance_lock = threading.Lock()
+
+
+def get_storage() -> DatabaseStorage:
+    """
+    Get the process-wide DatabaseStorage, creating it on first use
+
+    Creating the Supabase client is deferred until a request (or script) needs
+    it, so importing this module is cheap and each forked worker builds its own
+    HTTP connection pool.
+
+    Returns:
+        Shared DatabaseStorage instance
+    """
+    global _instance
+    if _instance is None:
+        with _instance_lock:
+            if _instance is None:
+                storage = DatabaseStorage()
+                storage.listen_for_evictions()
+                _instance = storage
+    return _instance
+
+
+class _LazyStorage:
+    """Module-level stand-in that forwards to get_storage() on first attribute access"""
+
+    def __getattr__(self, name):
+        return getattr(get_storage(), name)
+
+
+# Global database storage instance (created lazily)
+database_storage = _LazyStorage()
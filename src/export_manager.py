@@ -77,10 +77,11 @@ class ExportManager:
         Returns:
             List of summary dictionaries with metadata
         """
+        summary_texts = database_storage.get_summaries([video['video_id'] for video in channel_videos])
         summaries = []
         for video in channel_videos:
             video_id = video['video_id']
-            summary = database_storage.get_summary(video_id)
+            summary = summary_texts.get(video_id)
             
             if summary:
                 summaries.append({
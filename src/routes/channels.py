@@ -1,15 +1,23 @@
 """
 Channel-related routes for the YouTube Deep Summary application
 """
-from flask import Blueprint, render_template, request, send_file, jsonify
+from flask import Blueprint, render_template, request, send_file, jsonify, make_response
 from ..database_storage import database_storage
-from ..utils.helpers import format_summary_html
+from ..utils.helpers import format_summary_html, compute_etag, conditional_cache, set_revalidate_headers
 from ..export_manager import export_manager
 
 channels_bp = Blueprint('channels', __name__)
 
 
+def _channel_page_etag(channel_info, *extra):
+    """ETag for a channel page: changes when the channel, any video or any summary changes"""
+    return compute_etag(channel_info['channel_id'], channel_info.get('updated_at'), *extra,
+                        *database_storage.get_table_version('youtube_videos'),
+                        *database_storage.get_table_version('summaries'))
+
+
 @channels_bp.route('/channels')
+@conditional_cache('youtube_channels', 'youtube_videos', 'summaries')
 def channels_page():
     """Display all channels with video counts"""
     try:
@@ -52,11 +60,6 @@ def channel_overview(channel_handle):
         # Get ALL channel statistics in a single comprehensive call (SUPER OPTIMIZED)
         channel_stats = database_storage.get_channel_summary_stats(channel_info['channel_id'])
         
-        # Process recent videos for display
-        for video in recent_videos:
-            video['thumbnail_url'] = f"https://img.youtube.com/vi/{video['video_id']}/maxresdefault.jpg"
-            # has_summary already set by get_channel_videos_recent
-        
         return render_template('channel_overview.html',
                              channel_info=channel_info,
                              channel_handle=channel_handle,
@@ -87,6 +90,10 @@ def channel_videos(channel_handle):
             return render_template('error.html', 
                                  error_message=f"Channel not found: {channel_handle}"), 404
         
+        etag = _channel_page_etag(channel_info, sort_by)
+        if etag and request.if_none_match.contains_weak(etag):
+            return '', 304
+        
         # Get videos for this channel with sorting
         channel_videos_list = database_storage.get_videos_by_channel(
             channel_id=channel_info['channel_id'], 
@@ -97,20 +104,21 @@ def channel_videos(channel_handle):
             return render_template('error.html', 
                                  error_message=f"No videos found for channel: {channel_handle}"), 404
         
-        # Check which videos have summaries
+        # Check which videos have summaries in a single batched query
+        summarized_ids = database_storage.summaries_present([video['video_id'] for video in channel_videos_list])
         for video in channel_videos_list:
-            video['has_summary'] = database_storage.get_summary(video['video_id']) is not None
-            video['thumbnail_url'] = f"https://img.youtube.com/vi/{video['video_id']}/maxresdefault.jpg"
+            video['has_summary'] = video['video_id'] in summarized_ids
         
         # Use channel name from channel_info
         display_name = channel_info['channel_name']
         
-        return render_template('channel_videos.html', 
-                             channel_name=display_name,
-                             channel_info=channel_info,
-                             videos=channel_videos_list,
-                             total_videos=len(channel_videos_list),
-                             current_sort=sort_by)
+        response = make_response(render_template('channel_videos.html', 
+                                                 channel_name=display_name,
+                                                 channel_info=channel_info,
+                                                 videos=channel_videos_list,
+                                                 total_videos=len(channel_videos_list),
+                                                 current_sort=sort_by))
+        return set_revalidate_headers(response, etag)
         
     except Exception as e:
         return render_template('error.html', 
@@ -127,6 +135,10 @@ def channel_summaries(channel_handle):
             return render_template('error.html', 
                                  error_message=f"Channel not found: {channel_handle}"), 404
         
+        etag = _channel_page_etag(channel_info)
+        if etag and request.if_none_match.contains_weak(etag):
+            return '', 304
+        
         # Get videos for this channel
         channel_videos = database_storage.get_videos_by_channel(channel_id=channel_info['channel_id'])
         
@@ -134,23 +146,20 @@ def channel_summaries(channel_handle):
             return render_template('error.html', 
                                  error_message=f"No videos found for channel: {channel_handle}"), 404
         
-        # Get summaries for each video
+        # Get summaries for all videos in one batched query
+        summaries_html = database_storage.get_summaries_html([video['video_id'] for video in channel_videos])
         summaries = []
         for video in channel_videos:
             video_id = video['video_id']
-            summary = database_storage.get_summary(video_id)
+            summary_html = summaries_html.get(video_id)
             
-            if summary:
-                summary_html = format_summary_html(summary)
-                print(f"Converted summary for {video_id}: markdown -> HTML conversion applied")
-                
+            if summary_html:
                 summaries.append({
                     'video_id': video_id,
                     'title': video['title'],
                     'channel_name': video.get('channel_name'),
                     'channel_id': video.get('channel_id'),
                     'duration': video['duration'],
-                    'thumbnail_url': f"https://img.youtube.com/vi/{video_id}/maxresdefault.jpg",
                     'summary': summary_html,
                     'published_at': video.get('published_at'),
                     'url_path': video.get('url_path')
@@ -159,12 +168,13 @@ def channel_summaries(channel_handle):
         # Use channel name from channel_info
         display_name = channel_info['channel_name']
         
-        return render_template('channel_summaries.html', 
-                             channel_name=display_name,
-                             channel_info=channel_info,
-                             summaries=summaries,
-                             total_videos=len(channel_videos),
-                             summarized_videos=len(summaries))
+        response = make_response(render_template('channel_summaries.html', 
+                                                 channel_name=display_name,
+                                                 channel_info=channel_info,
+                                                 summaries=summaries,
+                                                 total_videos=len(channel_videos),
+                                                 summarized_videos=len(summaries)))
+        return set_revalidate_headers(response, etag)
         
     except Exception as e:
         return render_template('error.html', 
@@ -208,13 +218,14 @@ def channel_blog(channel_handle):
             return render_template('error.html', 
                                  error_message=f"Channel not found: {channel_handle}"), 404
         
-        # Get all videos for this channel
-        channel_videos = database_storage.get_videos_by_channel(channel_id=channel_info['channel_id'])
+        etag = _channel_page_etag(channel_info, 'blog')
+        if etag and request.if_none_match.contains_weak(etag):
+            return '', 304
         
-        # Filter videos that have summaries and sort by published_at (most recent first)
+        # Get videos that have summaries (most recent first)
         videos_with_summaries = []
-        for video in channel_videos:
-            summary = database_storage.get_summary(video['video_id'])
+        for video in database_storage.get_channel_summarized_videos(channel_info['channel_id']):
+            summary = video['summary']
             if summary:
                 videos_with_summaries.append({
                     'video_id': video['video_id'],
@@ -222,7 +233,6 @@ def channel_blog(channel_handle):
                     'channel_name': video.get('channel_name'),
                     'channel_id': video.get('channel_id'),
                     'duration': video['duration'],
-                    'thumbnail_url': f"https://img.youtube.com/vi/{video['video_id']}/maxresdefault.jpg",
                     'summary': summary,
                     'published_at': video.get('published_at'),
                     'url_path': video.get('url_path'),
@@ -254,14 +264,15 @@ def channel_blog(channel_handle):
         # Calculate if there are more posts for infinite scrolling
         has_more_posts = len(videos_with_summaries) > posts_per_page
         
-        return render_template('blog.html', 
-                             channel_info=channel_info,
-                             channel_handle=channel_handle,
-                             summary_count=len(videos_with_summaries),
-                             initial_posts=initial_posts,
-                             recent_posts=recent_posts,
-                             has_more_posts=has_more_posts,
-                             total_posts=len(videos_with_summaries))
+        response = make_response(render_template('blog.html', 
+                                                 channel_info=channel_info,
+                                                 channel_handle=channel_handle,
+                                                 summary_count=len(videos_with_summaries),
+                                                 initial_posts=initial_posts,
+                                                 recent_posts=recent_posts,
+                                                 has_more_posts=has_more_posts,
+                                                 total_posts=len(videos_with_summaries)))
+        return set_revalidate_headers(response, etag)
         
     except Exception as e:
         return render_template('error.html', 
@@ -282,10 +293,11 @@ def individual_blog_post(channel_handle, post_slug):
         channel_videos = database_storage.get_videos_by_channel(channel_id=channel_info['channel_id'])
         
         # Find the video matching the post slug
+        summarized_ids = database_storage.summaries_present([video['video_id'] for video in channel_videos])
         target_video = None
         for video in channel_videos:
             # Check if this video has a summary and matches the slug
-            if video.get('url_path') and video['url_path'] == post_slug:
+            if video.get('url_path') and video['url_path'] == post_slug and video['video_id'] in summarized_ids:
                 summary = database_storage.get_summary(video['video_id'])
                 if summary:
                     target_video = video
@@ -299,8 +311,7 @@ def individual_blog_post(channel_handle, post_slug):
         # Get all videos with summaries for navigation (sorted by publish date)
         videos_with_summaries = []
         for video in channel_videos:
-            summary = database_storage.get_summary(video['video_id'])
-            if summary:
+            if video['video_id'] in summarized_ids:
                 videos_with_summaries.append({
                     'video_id': video['video_id'],
                     'title': video['title'],
@@ -350,11 +361,7 @@ def channel_chat(channel_handle):
         # Get summary count for this channel
         channel_videos = database_storage.get_videos_by_channel(channel_id=channel_info['channel_id'])
         
-        summary_count = 0
-        for video in channel_videos:
-            summary = database_storage.get_summary(video['video_id'])
-            if summary:
-                summary_count += 1
+        summary_count = len(database_storage.summaries_present([video['video_id'] for video in channel_videos]))
         
         # Only allow chat if there are summaries available
         if summary_count == 0:
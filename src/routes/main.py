@@ -1,6 +1,7 @@
 """
 Main routes for the YouTube Deep Summary application
 """
+import logging
 from flask import Blueprint, request, render_template, redirect
 from ..database_storage import database_storage
 from ..video_processing import video_processor
@@ -8,6 +9,8 @@ from ..utils.helpers import extract_video_id
 
 main_bp = Blueprint('main', __name__)
 
+logger = logging.getLogger(__name__)
+
 
 @main_bp.route('/')
 def index():
@@ -31,15 +34,8 @@ def watch():
                              error_message="Invalid video ID format"), 400
     
     try:
-        # Get video from database to find channel handle and URL path
-        video_data = database_storage.get_all_cached_videos()
-        
-        # Find the video by video_id
-        target_video = None
-        for video in video_data:
-            if video['video_id'] == video_id:
-                target_video = video
-                break
+        # Look up the video's channel handle and URL path
+        target_video = database_storage.get_video_url_info(video_id)
         
         if not target_video:
             # Video not found in database, try to automatically import it
@@ -53,11 +49,7 @@ def watch():
                                      error_message=f"Video not found and automatic import failed: {video_id}. Error: {result['error']}"), 404
             
             # Now try to find the video again
-            video_data = database_storage.get_all_cached_videos()
-            for video in video_data:
-                if video['video_id'] == video_id:
-                    target_video = video
-                    break
+            target_video = database_storage.get_video_url_info(video_id)
             
             if not target_video:
                 return render_template('error.html', 
@@ -72,7 +64,7 @@ def watch():
             # Remove @ from handle if present for URL construction
             clean_handle = handle.lstrip('@')
             new_url = f"/@{clean_handle}/{url_path}"
-            print(f"Redirecting /watch?v={video_id} to {new_url}")
+            logger.debug("Redirecting /watch?v=%s to %s", video_id, new_url)
             return redirect(new_url)
         else:
             # Missing handle or url_path, show error
@@ -89,6 +81,7 @@ def watch():
 
 @main_bp.route('/favicon.ico')
 def favicon():
-    """Serve favicon from static directory"""
-    from flask import current_app
-    return current_app.send_static_file('favicon.ico')
\ No newline at end of file
+    """Serve favicon from static directory (nginx serves it directly in production)"""
+    from flask import current_app, send_from_directory
+    return send_from_directory(current_app.static_folder, 'favicon.svg',
+                               mimetype='image/svg+xml', max_age=30 * 24 * 3600)
\ No newline at end of file
@@ -1,11 +1,10 @@
 from flask import Blueprint, render_template, request, jsonify, redirect, url_for, flash
-from src.database_storage import DatabaseStorage
+from src.database_storage import database_storage as db_storage
 from src.summarizer import TranscriptSummarizer
 from src.config import Config
 import os
 
 settings_bp = Blueprint('settings', __name__, url_prefix='/settings')
-db_storage = DatabaseStorage()
 
 @settings_bp.route('/')
 def settings_page():
@@ -1,28 +1,61 @@
 """
 Snippets-related routes for the YouTube Deep Summary application
 """
-from flask import Blueprint, render_template
+import logging
+from flask import Blueprint, Response, render_template, stream_template
 from ..snippet_manager import snippet_manager
 
 snippets_bp = Blueprint('snippets', __name__)
 
+logger = logging.getLogger(__name__)
+
+
+def _stream_page(template_name, **context):
+    """
+    Stream a template, rendering its first chunk before the response starts
+
+    Errors loading the template or rendering that first chunk still reach the
+    caller's error page. Once the 200 status has been sent an error can't replace
+    the page, so later errors are logged and end the stream with a short notice.
+
+    Args:
+        template_name: Template to render
+        **context: Template variables
+
+    Returns:
+        Streaming HTML response
+    """
+    chunks = stream_template(template_name, **context)
+    first_chunk = next(chunks, '')
+
+    def generate():
+        yield first_chunk
+        try:
+            yield from chunks
+        except Exception:
+            logger.exception("Error while streaming %s", template_name)
+            yield '<p class="error">Error rendering the rest of this page. Please reload.</p>'
+
+    return Response(generate(), mimetype='text/html')
+
 
 @snippets_bp.route('/snippets')
 def snippets_page():
     """Display channels that have snippets"""
     try:
-        # Get all snippets
-        all_snippets = snippet_manager.storage.get_memory_snippets(limit=1000)
-        
-        # Group snippets by channel using business logic
-        channels = snippet_manager.group_snippets_by_channel(all_snippets)
+        # Get per-channel snippet counts aggregated in the database
+        channels = snippet_manager.get_channel_groups()
         
-        # Get statistics
-        stats = snippet_manager.get_snippet_statistics()
+        # The page only shows totals, which the channel groups already carry
+        stats = {
+            'total_snippets': sum(channel['total_snippets'] for channel in channels),
+            'videos_with_snippets': sum(channel['video_count'] for channel in channels)
+        }
         
-        return render_template('snippet_channels.html', 
-                             channels=channels,
-                             stats=stats)
+        # Stream the page so rendering overlaps with sending large channel lists
+        return _stream_page('snippet_channels.html', 
+                            channels=channels,
+                            stats=stats)
         
     except Exception as e:
         return render_template('error.html', 
@@ -34,6 +67,8 @@ def test_snippets_channel(channel_name):
     """Test route for debugging snippets"""
     try:
         snippets = snippet_manager.storage.get_memory_snippets(limit=10)
+        if snippets and logger.isEnabledFor(logging.DEBUG):
+            logger.debug("First snippet: %r", snippets[0])
         return f"Channel: {channel_name}, Total snippets: {len(snippets)}, First snippet: {snippets[0] if snippets else 'None'}"
     except Exception as e:
         return f"Error: {e}"
@@ -43,7 +78,7 @@ def test_snippets_channel(channel_name):
 def snippets_channel_page(channel_handle):
     """Display snippets for a specific channel by handle"""
     try:
-        print(f"Loading snippets for channel: {channel_handle}")
+        logger.debug("Loading snippets for channel: %s", channel_handle)
         
         # Get snippets for channel using business logic
         result = snippet_manager.get_snippets_by_channel_handle(channel_handle, limit=1000)
@@ -55,7 +90,7 @@ def snippets_channel_page(channel_handle):
         channel_info = result['channel_info']
         channel_snippets = result['snippets']
         
-        print(f"Filtered snippets for channel {channel_handle}: {len(channel_snippets)}")
+        logger.debug("Filtered snippets for channel %s: %d", channel_handle, len(channel_snippets))
         
         # If no snippets found, return empty page
         if not channel_snippets:
@@ -68,16 +103,13 @@ def snippets_channel_page(channel_handle):
         # Group snippets by video using business logic
         video_groups = snippet_manager.group_snippets_by_video(channel_snippets)
         
-        return render_template('snippets.html', 
-                             video_groups=video_groups,
-                             channel_name=channel_info['channel_name'],
-                             channel_info=channel_info,
-                             stats={'total_snippets': result['total_count']})
+        return _stream_page('snippets.html', 
+                            video_groups=video_groups,
+                            channel_name=channel_info['channel_name'],
+                            channel_info=channel_info,
+                            stats={'total_snippets': result['total_count']})
         
     except Exception as e:
-        print(f"Error in snippets_channel_page for channel {channel_handle}: {e}")
-        print(f"Exception type: {type(e)}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Error in snippets_channel_page for channel %s", channel_handle)
         return render_template('error.html', 
                              error_message=f"Error loading channel snippets: {str(e)}"), 500
\ No newline at end of file
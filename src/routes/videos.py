@@ -3,13 +3,14 @@ Video-related routes for the YouTube Deep Summary application
 """
 from flask import Blueprint, render_template, request
 from ..database_storage import database_storage
-from ..utils.helpers import format_summary_html
+from ..utils.helpers import conditional_cache
 from ..video_processing import video_processor
 
 videos_bp = Blueprint('videos', __name__)
 
 
 @videos_bp.route('/videos')
+@conditional_cache('youtube_videos', 'transcripts', 'summaries')
 def videos_page():
     """Display all saved videos with pagination"""
     try:
@@ -118,10 +119,8 @@ def video_by_url_path(channel_handle, url_path):
                 'channel_id': video.get('channel_id')
             }
         
-        # Get summary from database and convert markdown to HTML
-        summary = database_storage.get_summary(video_id)
-        if summary:
-            summary = format_summary_html(summary)
+        # Get the pre-rendered summary HTML from the database
+        summary = database_storage.get_summary_html(video_id)
         
         # Get memory snippets for this video
         snippets = database_storage.get_memory_snippets(video_id=video_id)
@@ -134,9 +133,6 @@ def video_by_url_path(channel_handle, url_path):
         for chapter_summary in chapter_summaries:
             chapter_summaries_lookup[chapter_summary['chapter_time']] = chapter_summary
         
-        # Add thumbnail URL
-        thumbnail_url = f"https://img.youtube.com/vi/{video_id}/maxresdefault.jpg"
-        
         # Get published_at from the video data
         published_at = video.get('published_at')
         
@@ -153,7 +149,6 @@ def video_by_url_path(channel_handle, url_path):
                              has_summary=bool(summary and summary.strip()),
                              snippets=snippets,
                              chapter_summaries_lookup=chapter_summaries_lookup,
-                             thumbnail_url=thumbnail_url,
                              has_transcript=has_transcript,
                              has_chapters=has_chapters,
                              published_at=published_at,
@@ -9,6 +9,7 @@ filtering, validation, and processing operations.
 from typing import List, Dict, Optional, Any
 from datetime import datetime
 from .database_storage import database_storage
+from .utils.helpers import youtube_thumbnail_url
 
 
 class SnippetManager:
@@ -85,13 +86,8 @@ class SnippetManager:
         Returns:
             List of snippet dictionaries filtered by channel
         """
-        all_snippets = self.storage.get_memory_snippets(limit=limit)
-        
-        # Filter by channel_id
-        channel_snippets = [
-            snippet for snippet in all_snippets 
-            if snippet.get('channel_id') == channel_id
-        ]
+        # The channel filter runs in the database, so only this channel's rows are fetched
+        channel_snippets = self.storage.get_memory_snippets(limit=limit, channel_id=channel_id)
         
         return self._enrich_snippets_with_metadata(channel_snippets)
     
@@ -131,7 +127,7 @@ class SnippetManager:
         Group snippets by channel with statistics
         
         Args:
-            snippets: List of snippet dictionaries
+            snippets: List of snippet dictionaries, newest first
             
         Returns:
             List of channel groups with video and snippet counts
@@ -139,7 +135,7 @@ class SnippetManager:
         channel_groups = {}
         
         for snippet in snippets:
-            channel_name = snippet.get('channel_name', 'Unknown Channel')
+            channel_name = snippet.get('channel_name') or 'Unknown Channel'
             channel_id = snippet.get('channel_id')
             handle = snippet.get('handle')
             
@@ -154,76 +150,112 @@ class SnippetManager:
                     'thumbnail_url': snippet.get('channel_thumbnail_url'),
                     'videos': {},
                     'total_snippets': 0,
-                    'latest_date': ''
+                    # Snippets arrive newest first, so the first one seen is the latest
+                    'latest_date': snippet.get('created_at', '')
                 }
             
             # Process video information
             video_id = snippet['video_id']
             if video_id not in channel_groups[channel_key]['videos']:
-                video_info = self._extract_video_info_from_snippet(snippet)
                 channel_groups[channel_key]['videos'][video_id] = {
-                    'video_info': video_info,
+                    'video_info': self._extract_video_info_from_snippet(snippet),
                     'video_id': video_id,
                     'snippet_count': 0
                 }
             
             channel_groups[channel_key]['videos'][video_id]['snippet_count'] += 1
             channel_groups[channel_key]['total_snippets'] += 1
-            
-            # Track latest snippet date for channel
-            snippet_date = snippet.get('created_at', '')
-            if snippet_date > channel_groups[channel_key]['latest_date']:
-                channel_groups[channel_key]['latest_date'] = snippet_date
         
-        # Convert to list and add video counts
+        # Convert to list and add video counts; groups were created in order of
+        # each channel's newest snippet, so the list is already newest first
         channels = []
         for channel_key, group in channel_groups.items():
             group['video_count'] = len(group['videos'])
             channels.append(group)
         
-        # Sort channels by latest snippet date (newest first)
-        channels.sort(key=lambda x: x['latest_date'], reverse=True)
-        
+        return channels
+    
+    def get_channel_groups(self) -> List[Dict]:
+        """
+        Get snippet counts grouped by channel for the snippets overview page
+
+        Uses per-video counts aggregated in the database, falling back to
+        grouping individual snippets when the stats view is missing.
+
+        Returns:
+            List of channel groups, most recently snippeted channel first
+        """
+        video_stats = self.storage.get_memory_snippet_video_stats()
+        if video_stats is None:
+            return self.group_snippets_by_channel(self.storage.get_memory_snippets(limit=1000))
+
+        channel_groups = {}
+        for row in video_stats:
+            channel_key = row.get('channel_id') or row.get('channel_name') or 'Unknown Channel'
+
+            # Rows arrive newest first, so the first row seen sets the channel's latest date
+            group = channel_groups.get(channel_key)
+            if group is None:
+                group = channel_groups[channel_key] = {
+                    'channel_name': row.get('channel_name') or 'Unknown Channel',
+                    'channel_id': row.get('channel_id'),
+                    'handle': row.get('handle'),
+                    'thumbnail_url': row.get('channel_thumbnail_url'),
+                    'videos': {},
+                    'total_snippets': 0,
+                    'latest_date': row.get('latest_date', '')
+                }
+
+            group['videos'][row['video_id']] = {
+                'video_info': {
+                    'title': row.get('title') or f"Video {row['video_id']}",
+                    'thumbnail_url': youtube_thumbnail_url(row['video_id']),
+                    'url_path': row.get('url_path')
+                },
+                'video_id': row['video_id'],
+                'url_path': row.get('url_path'),
+                'handle': row.get('handle'),
+                'snippet_count': row['snippet_count']
+            }
+            group['total_snippets'] += row['snippet_count']
+
+        channels = list(channel_groups.values())
+        for group in channels:
+            group['video_count'] = len(group['videos'])
+
         return channels
     
     def group_snippets_by_video(self, snippets: List[Dict]) -> List[Dict]:
         """
-        Group snippets by video with sorting
+        Group snippets by video, keeping the newest-first order
         
         Args:
-            snippets: List of snippet dictionaries
+            snippets: List of snippet dictionaries, newest first
             
         Returns:
-            List of video groups with sorted snippets
+            List of video groups, each with its snippets newest first
         """
         grouped_snippets = {}
         
         for snippet in snippets:
             video_id = snippet['video_id']
             if video_id not in grouped_snippets:
-                video_info = self._extract_video_info_from_snippet(snippet)
                 grouped_snippets[video_id] = {
-                    'video_info': video_info,
+                    'video_info': self._extract_video_info_from_snippet(snippet),
                     'video_id': video_id,
                     'channel_name': snippet.get('channel_name'),
                     'channel_id': snippet.get('channel_id'),
                     'handle': snippet.get('handle'),
-                    'url_path': snippet.get('youtube_videos', {}).get('url_path'),
+                    'url_path': (snippet.get('youtube_videos') or {}).get('url_path'),
                     'snippets': []
                 }
             grouped_snippets[video_id]['snippets'].append(snippet)
         
-        # Convert to list and sort
-        video_groups = []
-        for video_id, group in grouped_snippets.items():
-            # Sort snippets within group by creation date (newest first)
-            group['snippets'].sort(key=lambda x: x.get('created_at', ''), reverse=True)
-            # Use the newest snippet's date for group sorting
-            group['latest_date'] = group['snippets'][0].get('created_at', '') if group['snippets'] else ''
-            video_groups.append(group)
-        
-        # Sort groups by latest snippet date (newest first)
-        video_groups.sort(key=lambda x: x['latest_date'], reverse=True)
+        # Snippets arrive newest first (ORDER BY created_at DESC), so each group's
+        # snippets are already sorted and groups were created newest first
+        video_groups = list(grouped_snippets.values())
+        for group in video_groups:
+            group['latest_date'] = group['snippets'][0].get('created_at', '')
         
         return video_groups
     
@@ -337,9 +369,7 @@ class SnippetManager:
                 any(query_lower in tag for tag in tags)):
                 matching_snippets.append(snippet)
         
-        # Limit results and sort by relevance (creation date for now)
-        matching_snippets.sort(key=lambda x: x.get('created_at', ''), reverse=True)
-        
+        # Results keep the database's newest-first order
         return matching_snippets[:limit]
     
     def _validate_snippet_input(self, video_id: str, snippet_text: str) -> Dict[str, Any]:
@@ -394,13 +424,14 @@ class SnippetManager:
         return snippets
     
     def _extract_video_info_from_snippet(self, snippet: Dict) -> Dict:
-        """Extract video information from snippet data"""
-        video_info = snippet.get('youtube_videos', {})
+        """Extract video information from snippet data, with placeholders for deleted videos"""
+        video_info = snippet.get('youtube_videos') or {}
         if not video_info:
+            # Snippets outlive their video, so there may be nothing to embed
             video_info = {
                 'title': f'Video {snippet["video_id"]}',
-                'channel_name': snippet.get('channel_name', 'Unknown Channel'),
-                'thumbnail_url': f"https://img.youtube.com/vi/{snippet['video_id']}/maxresdefault.jpg"
+                'channel_name': snippet.get('channel_name') or 'Unknown Channel',
+                'thumbnail_url': youtube_thumbnail_url(snippet['video_id'])
             }
         return video_info
     
@@ -11,6 +11,7 @@ import re
 import textwrap
 from typing import List, Dict, Optional
 from openai import OpenAI
+from .config import Config
 try:
     import anthropic
     ANTHROPIC_AVAILABLE = True
@@ -18,6 +19,11 @@ except ImportError:
     ANTHROPIC_AVAILABLE = False
     anthropic = None
 
+# Environment fallbacks, read once at import (settings reloads happen per request)
+_DEFAULT_MODEL = os.getenv('OPENAI_MODEL', 'gpt-4.1')
+_DEFAULT_MAX_TOKENS = int(os.getenv('OPENAI_MAX_TOKENS', '8192'))
+_DEFAULT_TEMPERATURE = float(os.getenv('OPENAI_TEMPERATURE', '0.7'))
+
 
 class TranscriptSummarizer:
     """Handles transcript summarization using OpenAI and Anthropic APIs"""
@@ -46,15 +52,15 @@ class TranscriptSummarizer:
             db_settings = database_storage.get_summarizer_settings()
             
             # API Keys (always from environment for security)
-            self.openai_api_key = os.getenv('OPENAI_API_KEY')
+            self.openai_api_key = Config.OPENAI_API_KEY
             self.openai_client = None
-            self.anthropic_api_key = os.getenv('ANTHROPIC_API_KEY')
+            self.anthropic_api_key = Config.ANTHROPIC_API_KEY
             self.anthropic_client = None
             
             # Generic settings (from database with fallbacks)
-            self.model = db_settings.get('model') or os.getenv('OPENAI_MODEL', 'gpt-4.1')
-            self.max_tokens = db_settings.get('max_tokens') or int(os.getenv('OPENAI_MAX_TOKENS', '8192'))
-            self.temperature = db_settings.get('temperature') or float(os.getenv('OPENAI_TEMPERATURE', '0.7'))
+            self.model = db_settings.get('model') or _DEFAULT_MODEL
+            self.max_tokens = db_settings.get('max_tokens') or _DEFAULT_MAX_TOKENS
+            self.temperature = db_settings.get('temperature') or _DEFAULT_TEMPERATURE
             self.preferred_provider = db_settings.get('preferred_provider', 'openai')
             
             # Summarization features
@@ -65,15 +71,15 @@ class TranscriptSummarizer:
         except Exception as e:
             print(f"Warning: Could not load settings from database, using environment variables: {e}")
             # Fallback to environment variables only
-            self.openai_api_key = os.getenv('OPENAI_API_KEY')
+            self.openai_api_key = Config.OPENAI_API_KEY
             self.openai_client = None
-            self.anthropic_api_key = os.getenv('ANTHROPIC_API_KEY')
+            self.anthropic_api_key = Config.ANTHROPIC_API_KEY
             self.anthropic_client = None
             
             # Generic fallback settings
-            self.model = os.getenv('OPENAI_MODEL', 'gpt-4.1')
-            self.max_tokens = int(os.getenv('OPENAI_MAX_TOKENS', '8192'))
-            self.temperature = float(os.getenv('OPENAI_TEMPERATURE', '0.7'))
+            self.model = _DEFAULT_MODEL
+            self.max_tokens = _DEFAULT_MAX_TOKENS
+            self.temperature = _DEFAULT_TEMPERATURE
             self.preferred_provider = 'openai'
             
             self.enable_chapter_awareness = True
@@ -6,11 +6,38 @@ A module that handles transcript extraction from YouTube videos using multiple m
 with fallback support and proxy configuration.
 """
 
-import os
 import time
 import threading
 from typing import List, Dict, Optional
-from youtube_transcript_api import YouTubeTranscriptApi
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from youtube_transcript_api import YouTubeTranscriptApi, NoTranscriptFound
+from .config import Config
+
+
+def _build_session(proxies: Optional[Dict] = None) -> requests.Session:
+    """Build a keep-alive session shared by all transcript requests to YouTube"""
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=32,
+        pool_maxsize=32,
+        max_retries=Retry(total=2, backoff_factor=0.2)
+    )
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    if proxies:
+        session.proxies.update(proxies)
+    return session
+
+
+def _format_entries(transcript_list: List[Dict]) -> List[Dict]:
+    """Convert raw transcript entries to {time, text, formatted_time} dicts in one pass"""
+    return [
+        {'time': start, 'text': entry['text'], 'formatted_time': '%02d:%02d' % divmod(int(start), 60)}
+        for entry in transcript_list
+        for start in (entry['start'],)
+    ]
 
 
 class TranscriptExtractor:
@@ -18,13 +45,12 @@ class TranscriptExtractor:
     
     def __init__(self):
         """Initialize the transcript extractor with proxy configuration"""
-        self.proxy = os.getenv('YOUTUBE_PROXY')
-        self.proxies = None
-        if self.proxy:
-            self.proxies = {
-                'http': f'http://{self.proxy}',
-                'https': f'http://{self.proxy}'
-            }
+        self.proxy = Config.YOUTUBE_PROXY
+        self.proxies = Config.get_proxy_config()
+        
+        # One pooled session so TLS and TCP setup to youtube.com are reused across fetches
+        self.session = _build_session(self.proxies)
+        self.api = YouTubeTranscriptApi(http_client=self.session)
     
     def extract_transcript(self, video_id: str, timeout: int = 30) -> List[Dict]:
         """
@@ -54,58 +80,28 @@ class TranscriptExtractor:
             
             def fetch_transcript():
                 try:
-                    # First try to get English transcript directly
+                    # List the available transcripts once, then download a single one
+                    print(f"[{time.time() - start_time:.1f}s] Listing available transcripts...")
+                    transcript_list_data = self.api.list(video_id)
+                    
+                    # Prefer English, otherwise fall back to the first available transcript
                     try:
-                        print(f"[{time.time() - start_time:.1f}s] Attempting English transcript...")
-                        transcript_list = YouTubeTranscriptApi.get_transcript(
-                            video_id, 
-                            languages=['en'], 
-                            proxies=self.proxies
-                        )
-                        print(f"[{time.time() - start_time:.1f}s] Successfully fetched English transcript with {len(transcript_list)} entries")
-                        result['transcript_list'] = transcript_list
-                        result['language_used'] = "en (English)"
-                    except Exception as e:
-                        print(f"[{time.time() - start_time:.1f}s] English transcript not available: {str(e)}")
-                        
-                        # If English not available, get the first available transcript
-                        try:
-                            print(f"[{time.time() - start_time:.1f}s] Attempting to find available transcripts...")
-                            transcript_list_data = YouTubeTranscriptApi.list_transcripts(
-                                video_id, 
-                                proxies=self.proxies
-                            )
-                            
-                            # Get list of available language codes
-                            available_languages = []
-                            for transcript in transcript_list_data:
-                                available_languages.append(transcript.language_code)
-                                print(f"[{time.time() - start_time:.1f}s] Available: {transcript.language} ({transcript.language_code})")
-                            
-                            if available_languages:
-                                # Use the first available language code with the standard get_transcript method
-                                first_lang = available_languages[0]
-                                print(f"[{time.time() - start_time:.1f}s] Fetching {first_lang} transcript...")
-                                transcript_list = YouTubeTranscriptApi.get_transcript(
-                                    video_id, 
-                                    languages=[first_lang], 
-                                    proxies=self.proxies
-                                )
-                                
-                                # Get language name for logging
-                                first_transcript = next(iter(transcript_list_data))
-                                result['transcript_list'] = transcript_list
-                                result['language_used'] = f"{first_transcript.language} ({first_transcript.language_code})"
-                                print(f"[{time.time() - start_time:.1f}s] Successfully fetched {result['language_used']} transcript with {len(transcript_list)} entries")
-                            else:
-                                raise Exception("No transcripts found")
-                                
-                        except Exception as fallback_error:
-                            print(f"[{time.time() - start_time:.1f}s] Fallback transcript fetch failed: {str(fallback_error)}")
-                            raise Exception(f"No transcripts available for this video: {str(fallback_error)}")
-                            
+                        transcript = transcript_list_data.find_transcript(['en'])
+                    except NoTranscriptFound:
+                        print(f"[{time.time() - start_time:.1f}s] English transcript not available")
+                        transcript = next(iter(transcript_list_data), None)
+                        if transcript is None:
+                            raise Exception("No transcripts found")
+                    
+                    print(f"[{time.time() - start_time:.1f}s] Fetching {transcript.language_code} transcript...")
+                    transcript_list = transcript.fetch().to_raw_data()
+                    result['transcript_list'] = transcript_list
+                    result['language_used'] = f"{transcript.language} ({transcript.language_code})"
+                    print(f"[{time.time() - start_time:.1f}s] Successfully fetched {result['language_used']} transcript with {len(transcript_list)} entries")
+                    
                 except Exception as e:
-                    result['error'] = str(e)
+                    print(f"[{time.time() - start_time:.1f}s] Transcript fetch failed: {str(e)}")
+                    result['error'] = f"No transcripts available for this video: {str(e)}"
             
             # Start the fetch in a thread
             thread = threading.Thread(target=fetch_transcript)
@@ -134,13 +130,7 @@ class TranscriptExtractor:
             
         # Format the transcript
         print(f"[{time.time() - start_time:.1f}s] Formatting transcript...")
-        formatted_transcript = []
-        for entry in transcript_list:
-            formatted_transcript.append({
-                'time': entry['start'],
-                'text': entry['text'],
-                'formatted_time': f"{int(entry['start'] // 60):02d}:{int(entry['start'] % 60):02d}"
-            })
+        formatted_transcript = _format_entries(transcript_list)
         
         print(f"[{time.time() - start_time:.1f}s] Transcript language used: {language_used}")
         print(f"[{time.time() - start_time:.1f}s] Transcript extraction completed successfully")
@@ -157,10 +147,7 @@ class TranscriptExtractor:
             List of available languages with codes and names
         """
         try:
-            transcript_list_data = YouTubeTranscriptApi.list_transcripts(
-                video_id, 
-                proxies=self.proxies
-            )
+            transcript_list_data = self.api.list(video_id)
             
             languages = []
             for transcript in transcript_list_data:
@@ -189,22 +176,9 @@ class TranscriptExtractor:
             List of transcript entries
         """
         try:
-            transcript_list = YouTubeTranscriptApi.get_transcript(
-                video_id, 
-                languages=[language_code], 
-                proxies=self.proxies
-            )
-            
-            # Format the transcript
-            formatted_transcript = []
-            for entry in transcript_list:
-                formatted_transcript.append({
-                    'time': entry['start'],
-                    'text': entry['text'],
-                    'formatted_time': f"{int(entry['start'] // 60):02d}:{int(entry['start'] % 60):02d}"
-                })
+            transcript_list = self.api.fetch(video_id, languages=[language_code]).to_raw_data()
             
-            return formatted_transcript
+            return _format_entries(transcript_list)
             
         except Exception as e:
             raise Exception(f"Error downloading transcript in {language_code}: {str(e)}")
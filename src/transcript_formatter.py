@@ -145,7 +145,10 @@ class TranscriptFormatter:
         for entry in transcript:
             text = entry.get('text', '').strip()
             time = entry.get('time', 0)
-            formatted_time = entry.get('formatted_time', self._format_timestamp(time))
+            # Entries from the extractor carry formatted_time; only format when it's missing
+            formatted_time = entry.get('formatted_time')
+            if formatted_time is None:
+                formatted_time = self._format_timestamp(time)
             
             if not text:
                 continue
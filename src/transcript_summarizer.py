@@ -77,7 +77,9 @@ def format_transcript_for_display(transcript: List[Dict]) -> str:
     # Keep this utility function as it's not in the new summarizer
     formatted_lines = []
     for entry in transcript:
-        time_str = entry.get('formatted_time', f"{int(entry.get('time', 0) // 60):02d}:{int(entry.get('time', 0) % 60):02d}")
+        time_str = entry.get('formatted_time')
+        if time_str is None:
+            time_str = '%02d:%02d' % divmod(int(entry.get('time', 0)), 60)
         formatted_lines.append(f"[{time_str}] {entry['text']}")
     
     return "\n".join(formatted_lines)
@@ -0,0 +1,26 @@
+"""
+JSON provider for the YouTube Deep Summary application
+
+Serializes API responses with orjson when it is installed.
+"""
+from flask.json.provider import DefaultJSONProvider
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+class ORJSONProvider(DefaultJSONProvider):
+    """Flask JSON provider backed by orjson"""
+
+    def dumps(self, obj, **kwargs):
+        """Serialize obj to a JSON string, honouring indent for debug output"""
+        option = orjson.OPT_NON_STR_KEYS
+        if kwargs.get('indent'):
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, default=self.default, option=option).decode()
+
+    def loads(self, s, **kwargs):
+        """Deserialize a JSON string or bytes"""
+        return orjson.loads(s)
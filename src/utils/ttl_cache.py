@@ -0,0 +1,105 @@
+"""
+Process-local TTL cache with per-key locking
+
+Used to avoid repeating slow YouTube lookups (yt-dlp, Data API) for the same
+video within a few minutes, and to make concurrent requests for one video wait
+for a single lookup instead of each starting their own.
+"""
+import copy
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Hashable
+
+
+_MISSING = object()
+
+
+class TTLCache:
+    """Small LRU cache whose entries expire after a fixed number of seconds"""
+
+    def __init__(self, maxsize: int = 1024, ttl: float = 300, cache_none: bool = False):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.cache_none = cache_none
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+        self._key_locks = {}
+        # Bumped by pop() and clear(); a load that started before either is not stored
+        self._generation = 0
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return a copy of the cached value, or default if missing or expired"""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return default
+            expires_at, value = entry
+            if expires_at < time.monotonic():
+                del self._data[key]
+                return default
+            self._data.move_to_end(key)
+        return copy.deepcopy(value)
+
+    def set(self, key: Hashable, value: Any):
+        """Store a value, evicting the least recently used entry when full"""
+        with self._lock:
+            self._store(key, value)
+
+    def _store(self, key: Hashable, value: Any):
+        """Insert an entry and trim to maxsize (caller holds the lock)"""
+        self._data[key] = (time.monotonic() + self.ttl, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def pop(self, key: Hashable):
+        """Drop one entry if present"""
+        with self._lock:
+            self._data.pop(key, None)
+            self._generation += 1
+
+    def clear(self):
+        """Drop every cached entry"""
+        with self._lock:
+            self._data.clear()
+            self._generation += 1
+
+    def get_or_load(self, key: Hashable, loader: Callable[[], Any]) -> Any:
+        """
+        Return the cached value for key, calling loader at most once per key at a time
+
+        Args:
+            key: Cache key
+            loader: Zero-argument callable producing the value on a miss
+
+        Returns:
+            Cached or freshly loaded value (callers get their own copy)
+        """
+        value = self.get(key, _MISSING)
+        if value is not _MISSING:
+            return value
+
+        with self._lock:
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+
+        with key_lock:
+            # Another thread may have loaded the value while we waited
+            value = self.get(key, _MISSING)
+            if value is not _MISSING:
+                return value
+
+            with self._lock:
+                generation = self._generation
+
+            try:
+                value = loader()
+                if value is not None or self.cache_none:
+                    with self._lock:
+                        # Skip storing a value that was invalidated while it loaded
+                        if generation == self._generation:
+                            self._store(key, value)
+                return copy.deepcopy(value)
+            finally:
+                with self._lock:
+                    self._key_locks.pop(key, None)
@@ -1,6 +1,7 @@
 """
 Video processing module for transcript extraction and summarization
 """
+from concurrent.futures import ThreadPoolExecutor
 from .transcript_extractor import transcript_extractor
 from .chapter_extractor import chapter_extractor
 from .summarizer import summarizer
@@ -9,6 +10,9 @@ from .database_storage import database_storage
 from .youtube_api import youtube_api
 from .config import Config
 
+# Shared pool for independent YouTube lookups (video info, chapters, transcript)
+io_pool = ThreadPoolExecutor(max_workers=8, thread_name_prefix='video-io')
+
 
 class VideoProcessor:
     """Handles video processing including transcript extraction and AI summarization"""
@@ -50,19 +54,33 @@ class VideoProcessor:
             
             print(f"Processing settings - Transcript extraction: {enable_transcript_extraction}, Auto summary: {enable_auto_summary}, Chapter extraction: {enable_chapter_extraction}")
             
-            # Get video info from YouTube API (always needed for metadata)
+            # Video info, chapters and transcript are independent YouTube requests,
+            # so fetch them concurrently and wait for the slowest one
             print(f"Getting video info for {video_id}")
-            video_info = youtube_api.get_video_info(video_id)
+            video_info_future = io_pool.submit(youtube_api.get_video_info, video_id)
+            chapters_future = None
+            if enable_chapter_extraction:
+                print(f"Getting chapters for {video_id}")
+                chapters_future = io_pool.submit(self.chapter_extractor.extract_chapters, video_id)
+            transcript_future = None
+            if enable_transcript_extraction:
+                print(f"Getting transcript for {video_id}")
+                transcript_future = io_pool.submit(self.get_transcript, video_id)
+            
+            # Get video info from YouTube API (always needed for metadata)
+            video_info = video_info_future.result()
             
             if not video_info:
                 print(f"Failed to get video info for {video_id}")
+                for future in (chapters_future, transcript_future):
+                    if future:
+                        future.cancel()
                 return {'status': 'failed', 'error': 'Failed to get video information'}
             
             # Get chapters separately if enabled
             chapters = None
-            if enable_chapter_extraction:
-                print(f"Getting chapters for {video_id}")
-                chapters = self.chapter_extractor.extract_chapters(video_id)
+            if chapters_future:
+                chapters = chapters_future.result()
                 video_info['chapters'] = chapters
             else:
                 print(f"Chapter extraction disabled for {video_id} (disabled in settings)")
@@ -71,10 +89,9 @@ class VideoProcessor:
             # Get transcript only if enabled
             transcript = None
             formatted_transcript = None
-            if enable_transcript_extraction:
-                print(f"Getting transcript for {video_id}")
+            if transcript_future:
                 try:
-                    transcript = self.get_transcript(video_id)
+                    transcript = transcript_future.result()
                     # Format transcript
                     formatted_transcript = self.transcript_formatter.format_for_readability(transcript, video_info.get('chapters'))
                 except Exception as e:
@@ -96,7 +113,7 @@ class VideoProcessor:
             channel_info = None
             if channel_id:
                 channel_info = youtube_api.get_channel_info(channel_id)
-            database_storage.set(video_id, transcript, video_info, formatted_transcript, channel_id, channel_info)
+            video_data = database_storage.set(video_id, transcript, video_info, formatted_transcript, channel_id, channel_info)
             
             # Generate AI summary if summarizer is configured and auto summary is enabled
             summary_generated = False
@@ -132,7 +149,8 @@ class VideoProcessor:
                 'video_id': video_id,
                 'title': video_info.get('title', ''),
                 'summary_generated': summary_generated,
-                'transcript_extracted': enable_transcript_extraction and transcript is not None
+                'transcript_extracted': enable_transcript_extraction and transcript is not None,
+                'video_data': video_data
             }
             
         except Exception as e:
@@ -150,7 +168,7 @@ class VideoProcessor:
         
         # First check if summary already exists in database (unless force regeneration)
         if not force_regenerate:
-            existing_summary = database_storage.get_summary(video_id)
+            cached_data, existing_summary = database_storage.get_with_summary(video_id)
             if existing_summary:
                 print(f"Using existing summary for video {video_id}")
                 return existing_summary, True
@@ -162,7 +180,8 @@ class VideoProcessor:
         custom_prompt = default_prompt_data['prompt_text'] if default_prompt_data else None
         
         # Get video info and chapters from database to include in summary
-        cached_data = database_storage.get(video_id)
+        if force_regenerate:
+            cached_data = database_storage.get(video_id)
         chapters = None
         video_info = None
         if cached_data and cached_data.get('video_info'):
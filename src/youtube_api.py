@@ -13,6 +13,7 @@ except ImportError:
 
 from .config import Config
 from .utils.helpers import extract_channel_id_or_name
+from .utils.ttl_cache import TTLCache
 
 
 class YouTubeAPI:
@@ -20,6 +21,8 @@ class YouTubeAPI:
     
     def __init__(self):
         self.service = None
+        # Recent video lookups, so repeated requests for one video share a single API call
+        self._video_info_cache = TTLCache(maxsize=4096, ttl=300)
         if YOUTUBE_API_AVAILABLE and Config.YOUTUBE_API_KEY:
             try:
                 self.service = build('youtube', 'v3', developerKey=Config.YOUTUBE_API_KEY)
@@ -98,10 +101,14 @@ class YouTubeAPI:
         return channel_info['handle'] if channel_info else None
     
     def get_video_info(self, video_id):
-        """Get comprehensive video information from YouTube Data API"""
+        """Get comprehensive video information from YouTube Data API (cached for 5 minutes)"""
         if not self.service:
             return None
         
+        return self._video_info_cache.get_or_load(video_id, lambda: self._fetch_video_info(video_id))
+    
+    def _fetch_video_info(self, video_id):
+        """Request video information from the YouTube Data API"""
         try:
             # Request comprehensive video information
             video_request = self.service.videos().list(
@@ -411,6 +418,12 @@ class YouTubeAPI:
                     current_page_videos = []
                     videos_beyond_cutoff = 0
                     
+                    # Check which videos on this page already exist in one batched query
+                    from .database_storage import database_storage
+                    existing_ids = database_storage.videos_present(
+                        [item['snippet']['resourceId']['videoId'] for item in playlist_response.get('items', [])]
+                    )
+                    
                     for item in playlist_response.get('items', []):
                         video_id = item['snippet']['resourceId']['videoId']
                         snippet = item['snippet']
@@ -443,8 +456,7 @@ class YouTubeAPI:
                         
                         if include_video:
                             # Check if this video already exists for early stopping optimization
-                            from .database_storage import database_storage
-                            existing_video = database_storage.get(video_id)
+                            existing_video = video_id in existing_ids
                             
                             current_page_videos.append({
                                 'video_id': video_id,
@@ -626,11 +638,12 @@ class YouTubeAPI:
             
             new_videos = []
             existing_count = 0
+            existing_ids = database_storage.videos_present([video['video_id'] for video in videos])
             
             # Check each video to see if it already exists
             for video in videos:
                 video_id = video['video_id']
-                existing_video = database_storage.get(video_id)
+                existing_video = video_id in existing_ids
                 
                 if existing_video:
                     existing_count += 1
@@ -11,4 +11,5 @@ echo "  http://localhost:5000/"
 echo "  http://localhost:5000/watch?v=FjHtZnjNEBU"
 echo "  http://localhost:5000/api/transcript/FjHtZnjNEBU"
 echo ""
-python3 app.py
\ No newline at end of file
+# gunicorn serves requests concurrently (settings in gunicorn.conf.py)
+exec gunicorn -c gunicorn.conf.py
\ No newline at end of file
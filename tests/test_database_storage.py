@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+Test DatabaseStorage row handling against stubbed PostgREST responses
+"""
+import unittest
+import sys
+import os
+from datetime import datetime, timezone
+from types import SimpleNamespace
+
+# Add the repository root to the Python path (database_storage uses package imports)
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.database_storage import DatabaseStorage
+
+
+class _StubQuery:
+    """Chainable query stub whose execute() returns fixed rows"""
+
+    def __init__(self, rows):
+        self.rows = rows
+
+    def __getattr__(self, name):
+        return lambda *args, **kwargs: self
+
+    def execute(self):
+        return SimpleNamespace(data=self.rows, count=len(self.rows))
+
+
+class _StubClient:
+    """Supabase client stub returning fixed rows per table"""
+
+    def __init__(self, tables):
+        self.tables = tables
+
+    def table(self, name):
+        return _StubQuery(self.tables.get(name, []))
+
+
+def _storage(tables):
+    """DatabaseStorage with a stubbed client and no network setup"""
+    storage = DatabaseStorage.__new__(DatabaseStorage)
+    storage.supabase = _StubClient(tables)
+    return storage
+
+
+class TestEmbeddedRows(unittest.TestCase):
+    """Embeds are returned as objects once transcripts/video_chapters have UNIQUE (video_id)"""
+
+    VIDEO = {
+        'video_id': 'dQw4w9WgXcQ',
+        'title': 'Video',
+        'duration': 212,
+        'channel_id': 'UC123',
+        'created_at': '2024-01-01T00:00:00+00:00',
+        'published_at': None,
+        'url_path': 'video',
+        'youtube_channels': {'channel_name': 'Channel', 'channel_id': 'UC123', 'thumbnail_url': None, 'handle': 'chan'},
+    }
+
+    def test_get_many_with_object_embeds(self):
+        """Transcript and chapter embeds returned as objects are read like one-row lists"""
+        row = dict(self.VIDEO,
+                   transcripts={'transcript_data': [{'text': 'hi'}], 'formatted_transcript': 'hi', 'updated_at': None},
+                   video_chapters={'chapters_data': [{'title': 'Intro', 'time': 0}]})
+        storage = _storage({'youtube_videos': [row]})
+
+        data = storage.get_many(['dQw4w9WgXcQ'])['dQw4w9WgXcQ']
+        self.assertEqual(data['transcript'], [{'text': 'hi'}])
+        self.assertEqual(data['video_info']['chapters'], [{'title': 'Intro', 'time': 0}])
+
+    def test_get_many_with_null_embeds(self):
+        """A video whose one-to-one transcript embed is null is a miss"""
+        storage = _storage({'youtube_videos': [dict(self.VIDEO, transcripts=None, video_chapters=None)]})
+        self.assertEqual(storage.get_many(['dQw4w9WgXcQ']), {})
+
+    def test_list_entry_with_object_embeds(self):
+        """Listing counts work with object-shaped embeds when the stats view is missing"""
+        row = dict(self.VIDEO,
+                   transcripts={'transcript_data': [{'text': 'a'}, {'text': 'b'}]},
+                   video_chapters={'chapters_data': [{'title': 'Intro', 'time': 0}]},
+                   summaries=[])
+        storage = _storage({})
+
+        entry = storage._build_video_list_entry(row, {}, datetime.now(timezone.utc))
+        self.assertEqual(entry['transcript_entries'], 2)
+        self.assertEqual(entry['chapters_count'], 1)
+        self.assertFalse(entry['has_summary'])
+
+
+if __name__ == '__main__':
+    unittest.main()
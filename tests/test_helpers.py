@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+Test URL parsing helpers
+"""
+import unittest
+import sys
+import os
+
+# Add the src directory to the Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from utils.helpers import extract_video_id, extract_channel_id_or_name, normalize_summary_bullets
+
+
+class TestExtractVideoId(unittest.TestCase):
+    """Test extract_video_id"""
+
+    def test_plain_id(self):
+        """A bare 11-character ID is returned unchanged"""
+        self.assertEqual(extract_video_id('dQw4w9WgXcQ'), 'dQw4w9WgXcQ')
+
+    def test_url_formats(self):
+        """Watch, short, embed and extra-parameter URLs are supported"""
+        urls = [
+            'https://www.youtube.com/watch?v=dQw4w9WgXcQ',
+            'https://youtu.be/dQw4w9WgXcQ',
+            'https://www.youtube.com/embed/dQw4w9WgXcQ',
+            'https://www.youtube.com/watch?feature=share&v=dQw4w9WgXcQ',
+        ]
+        for url in urls:
+            with self.subTest(url=url):
+                self.assertEqual(extract_video_id(url), 'dQw4w9WgXcQ')
+
+    def test_invalid_input(self):
+        """Strings that are neither IDs nor video URLs return None"""
+        self.assertIsNone(extract_video_id('not a video'))
+        self.assertIsNone(extract_video_id('https://www.youtube.com/@channel'))
+
+
+
+class TestExtractChannelIdOrName(unittest.TestCase):
+    """Test extract_channel_id_or_name"""
+
+    def test_channel_id(self):
+        """Bare and /channel/ URL channel IDs are reported as IDs"""
+        channel_id = 'UC' + 'a' * 22
+        self.assertEqual(extract_channel_id_or_name(channel_id), (channel_id, 'id'))
+        self.assertEqual(extract_channel_id_or_name(f'https://www.youtube.com/channel/{channel_id}'), (channel_id, 'id'))
+
+    def test_custom_urls(self):
+        """Custom URLs, handles and legacy usernames are reported as custom names"""
+        cases = {
+            'https://www.youtube.com/c/SomeName': 'SomeName',
+            'https://www.youtube.com/@some.handle': 'some.handle',
+            'https://www.youtube.com/user/legacy_user': 'legacy_user',
+        }
+        for url, name in cases.items():
+            with self.subTest(url=url):
+                self.assertEqual(extract_channel_id_or_name(url), (name, 'custom'))
+
+    def test_plain_name(self):
+        """Anything else is treated as a custom channel name"""
+        self.assertEqual(extract_channel_id_or_name('Some Channel'), ('Some Channel', 'custom'))
+        self.assertEqual(extract_channel_id_or_name(''), (None, None))
+
+
+class TestNormalizeSummaryBullets(unittest.TestCase):
+    """Test bullet normalization applied when summaries are saved"""
+
+    def test_bullets_become_list_items(self):
+        """Leading bullets are rewritten, keeping indentation"""
+        self.assertEqual(normalize_summary_bullets('• One\n  • Two'), '* One\n  * Two')
+
+    def test_inline_bullets_untouched(self):
+        """Bullets inside a line and text without bullets are left alone"""
+        self.assertEqual(normalize_summary_bullets('A • B'), 'A • B')
+        self.assertEqual(normalize_summary_bullets('Plain text'), 'Plain text')
+        self.assertIsNone(normalize_summary_bullets(None))
+
+if __name__ == '__main__':
+    unittest.main()
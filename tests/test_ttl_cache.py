@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+Test the process-local TTL cache
+"""
+import unittest
+import threading
+import time
+import sys
+import os
+
+# Add the src directory to the Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from utils.ttl_cache import TTLCache
+
+
+class TestTTLCache(unittest.TestCase):
+    """Test TTLCache"""
+
+    def test_concurrent_loads_run_once(self):
+        """Concurrent misses for one key share a single loader call"""
+        cache = TTLCache()
+        calls = []
+
+        def loader():
+            calls.append(1)
+            time.sleep(0.05)
+            return {'title': 'Video'}
+
+        threads = [threading.Thread(target=cache.get_or_load, args=('abc', loader)) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(cache.get('abc'), {'title': 'Video'})
+
+    def test_entries_expire(self):
+        """Entries are dropped once their TTL has passed"""
+        cache = TTLCache(ttl=0.01)
+        cache.set('abc', 1)
+        time.sleep(0.02)
+        self.assertIsNone(cache.get('abc'))
+
+    def test_none_is_not_cached_by_default(self):
+        """Failed lookups returning None are retried on the next call"""
+        cache = TTLCache()
+        cache.get_or_load('abc', lambda: None)
+        self.assertEqual(cache.get_or_load('abc', lambda: 'loaded'), 'loaded')
+
+    def test_returns_copies(self):
+        """Callers mutating a returned value don't change the cached one"""
+        cache = TTLCache()
+        cache.get_or_load('abc', lambda: {'tags': ['a']})['tags'].append('b')
+        self.assertEqual(cache.get('abc'), {'tags': ['a']})
+
+
+    def test_pop_forces_reload(self):
+        """Popping a key makes the next lookup call the loader again"""
+        cache = TTLCache()
+        cache.get_or_load('abc', lambda: 'old')
+        cache.pop('abc')
+        cache.pop('missing')
+        self.assertEqual(cache.get_or_load('abc', lambda: 'new'), 'new')
+
+    def test_pop_during_load_discards_result(self):
+        """A value loaded before a concurrent pop is returned but not cached"""
+        cache = TTLCache()
+
+        def loader():
+            cache.pop('abc')  # e.g. another thread saves the video mid-load
+            return 'stale'
+
+        self.assertEqual(cache.get_or_load('abc', loader), 'stale')
+        self.assertEqual(cache.get_or_load('abc', lambda: 'fresh'), 'fresh')
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,9 @@
+"""
+WSGI entry point for the YouTube Deep Summary application
+
+Used by production servers, e.g.:
+    gunicorn -k gthread -w 4 --threads 8 -b 0.0.0.0:33079 wsgi:application
+"""
+from app import create_app
+
+application = create_app()